@@ -10,6 +10,7 @@ from pathlib import Path
 # Добавляем путь к модулю
 sys.path.insert(0, str(Path(__file__).parent))
 
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
 from pathlib import Path
@@ -60,6 +61,8 @@ def main():
     - Легко поддерживается (каждый модуль отвечает за одну вещь)
     - Переиспользуемость (компоненты можно использовать в других проектах)
     """
+    # Иконки с devicePixelRatio > 1 (HiDPI) отдаются QIcon без масштабирования до 1x
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -110,7 +111,9 @@ class TestCaseStep:
             name=name,
             description=description,
             expected_result=expected_result_raw,
-            status=str(data.get("status") or "pending").strip(),
+            # Набор статусов шагов мал: интернируем, чтобы сравнения с литералами
+            # ("passed", "pending", ...) проходили по совпадению ссылок
+            status=sys.intern(str(data.get("status") or "pending").strip()),
             bug_link=str(data.get("bugLink") or "").strip(),
             skip_reason=str(data.get("skipReason") or "").strip(),
             attachments=attachments_list,
@@ -1625,15 +1625,12 @@ class MainWindow(QMainWindow):
             return None
         
         try:
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
+            svg_content = icon_path.read_bytes()
             
             if color:
-                svg_content = svg_content.replace('currentColor', color)
-                svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-                svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
+                svg_content = svg_content.replace(b'currentColor', color.encode('ascii'))
             
-            renderer = QSvgRenderer(svg_content.encode('utf-8'))
+            renderer = QSvgRenderer(svg_content)
             if not renderer.isValid():
                 print(f"Невалидный SVG файл: {icon_path}")
                 return None
@@ -1849,6 +1846,7 @@ class MainWindow(QMainWindow):
         self.statusbar_save_button.setMinimumWidth(100)
         self.statusbar_save_button.setCursor(Qt.PointingHandCursor)
         self.statusbar_save_button.setVisible(False)  # Скрыта по умолчанию
+        self._save_button_highlighted = False
         self.statusbar_save_button.clicked.connect(self._on_save_button_clicked)
         
         # Добавляем кнопку в статус-бар (справа)
@@ -2780,7 +2778,10 @@ class MainWindow(QMainWindow):
     def _on_form_unsaved_state(self, has_changes: bool):
         """Обновление статуса при изменениях в форме"""
         # Управляем видимостью и подсветкой кнопки сохранения в статус-баре
-        if hasattr(self, "statusbar_save_button"):
+        # Состояние приходит на каждое изменение полей: кнопку трогаем только при его смене,
+        # чтобы не разбирать таблицу стилей заново на каждое нажатие клавиши
+        if hasattr(self, "statusbar_save_button") and has_changes != self._save_button_highlighted:
+            self._save_button_highlighted = has_changes
             self.statusbar_save_button.setVisible(has_changes)
             if has_changes:
                 self._highlight_save_button()
@@ -2808,6 +2809,10 @@ class MainWindow(QMainWindow):
     def _on_test_cases_updated(self):
         """Обработка обновления тест-кейсов после изменения статусов"""
         try:
+            # Дописываем отложенное автосохранение до перечитывания тест-кейсов с диска
+            if hasattr(self, 'form_widget'):
+                self.form_widget.flush_pending_auto_save(notify=False)
+            
             # Сохраняем состояние дерева
             expanded_state = self.tree_widget.capture_expanded_state()
             selected_filepath = self.tree_widget.capture_selected_item()
@@ -4169,6 +4174,10 @@ class MainWindow(QMainWindow):
         if hasattr(self, '_cleanup_llm_worker'):
             self._cleanup_llm_worker()
         
+        # Дописываем отложенное автосохранение статусов шагов
+        if hasattr(self, 'form_widget'):
+            self.form_widget.flush_pending_auto_save()
+        
         if self.isMaximized():
             geom = self.normalGeometry()
             geometry_data = {
@@ -1,8 +1,10 @@
 """Виджет формы редактирования тест-кейса"""
 
 import json
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import shutil
 import uuid
 
@@ -13,7 +15,7 @@ from PyQt5.QtWidgets import (
     QGridLayout,
     QLabel,
     QLineEdit,
-    QTextEdit,
+    QPlainTextEdit,
     QComboBox,
     QGroupBox,
     QPushButton,
@@ -25,6 +27,7 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
     QAbstractItemView,
     QMenu,
+    QAction,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
@@ -33,9 +36,10 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QDialog,
     QDialogButtonBox,
+    QButtonGroup,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent, QSize, QTimer
-from PyQt5.QtGui import QFont, QTextOption, QIcon, QPixmap, QPainter, QColor, QDragEnterEvent, QDropEvent, QDragLeaveEvent
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QEvent, QSize, QTimer, QSignalBlocker, QByteArray
+from PyQt5.QtGui import QFont, QTextOption, QIcon, QImage, QPixmap, QPixmapCache, QPainter, QColor, QDragEnterEvent, QDropEvent, QDragLeaveEvent
 from PyQt5.QtSvg import QSvgRenderer
 
 from ...models.test_case import TestCase, TestCaseStep
@@ -44,6 +48,176 @@ from ...utils.datetime_utils import format_datetime, get_current_datetime
 from ..styles.ui_metrics import UI_METRICS
 
 
+# Стили кнопок статуса шага: одна таблица стилей на всю таблицу шагов, кнопка выбирает
+# правило через динамические свойства statusKind/statusActive (см. _STATUS_BUTTONS_QSS)
+_STATUS_BUTTON_QSS_BASE = """
+    QToolButton[statusKind] {
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+        padding: 0px;
+        min-width: 24px;
+        max-width: 24px;
+        min-height: 24px;
+        max-height: 24px;
+    }
+    """
+# Активное состояние: цветной фон, белая иконка, без рамки.
+# Неактивное: прозрачный фон, иконка с цветом статуса, подсветка при наведении
+_STATUS_BUTTON_QSS_KIND = """
+    QToolButton[statusKind="{value}"][statusActive="true"] {{
+        background-color: {color};
+    }}
+    QToolButton[statusKind="{value}"][statusActive="false"]:hover {{
+        background-color: {color}33;
+    }}
+    """
+
+
+# Папка с иконками в корне проекта
+_ICONS_DIR = Path(__file__).parent.parent.parent.parent / "icons"
+
+
+# Маппинг иконок - статичные данные: файл читается один раз на процесс, а не при
+# создании каждой формы. Словарь общий для всех форм и только читается
+@lru_cache(maxsize=1)
+def _get_icon_mapping() -> Dict[str, Dict[str, str]]:
+    """Загрузить маппинг иконок из icons/icon_mapping.json."""
+    mapping_file = _ICONS_DIR / "icon_mapping.json"
+    
+    if mapping_file.exists():
+        try:
+            with open(mapping_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                # Поддерживаем как старый формат (плоский), так и новый (с секциями)
+                if isinstance(data, dict) and any(key in data for key in ['panels', 'context_menu', 'panel_buttons', 'status_icons', 'bulk_operations', 'step_actions']):
+                    return data
+                else:
+                    # Старый формат - возвращаем с секциями
+                    return {
+                        'panels': data if isinstance(data, dict) else {},
+                        'context_menu': {},
+                        'panel_buttons': {},
+                        'status_icons': {},
+                        'bulk_operations': {},
+                        'step_actions': {}
+                    }
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Ошибка загрузки маппинга иконок: {e}")
+    
+    # Возвращаем значения по умолчанию, если файл не найден
+    return {
+        'panels': {},
+        'context_menu': {},
+        'panel_buttons': {},
+        'status_icons': {
+            "passed": "check-circle.svg",
+            "failed": "x-circle.svg",
+            "skipped": "skip-forward.svg"
+        },
+        'bulk_operations': {
+            "mark_all_passed": "fast-forward.svg",
+            "reset_statuses": "refresh-ccw.svg"
+        },
+        'step_actions': {
+            "attach_file": "file.svg",
+            "add_above": "corner-up-left.svg",
+            "add_below": "corner-down-left.svg",
+            "move_up": "chevron-up.svg",
+            "move_down": "chevron-down.svg",
+            "delete": "x.svg"
+        }
+    }
+
+
+# SVG читается с диска один раз на файл: разные размеры одной иконки
+# растеризуются из уже прочитанных байтов
+@lru_cache(maxsize=64)
+def _read_svg_bytes(icon_name: str) -> Optional[bytes]:
+    """Прочитать SVG файл из папки icons как есть; None, если файла нет или он не читается."""
+    icon_path = _ICONS_DIR / icon_name
+    
+    if not icon_path.exists():
+        print(f"Иконка не найдена: {icon_path}")
+        return None
+    
+    try:
+        # QSvgRenderer принимает байты: декодировать в str и кодировать обратно не нужно
+        return icon_path.read_bytes()
+    except IOError as e:
+        print(f"Ошибка загрузки иконки {icon_name}: {e}")
+        return None
+
+
+# Иконки шагов повторяются в каждой строке таблицы: отрисованные пиксмапы хранятся в
+# общем для приложения QPixmapCache (LRU с ограничением по памяти) по ключу
+# файл/размер/цвет, поэтому переживают пересоздание формы и не растут без предела
+def _render_svg_icon(icon_name: str, size: int, color: Optional[str], dpr: float = 1.0) -> Optional[QIcon]:
+    """Отрисовать SVG иконку из папки icons в QIcon заданного размера и цвета.
+
+    dpr - devicePixelRatioF() виджета, для которого нужна иконка.
+    """
+    # Растеризуем сразу в физических пикселях экрана виджета: на HiDPI иконка
+    # рисуется 1:1, без масштабирования пиксмапа при каждой отрисовке
+    cache_key = f"tceditor_{icon_name}_{size}@{dpr}_{color}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return QIcon(pixmap)
+
+    pixel_size = round(size * dpr)
+    mask = _render_svg_mask(icon_name, pixel_size)
+    if mask is None:
+        return None
+
+    if color:
+        # Перекрашиваем уже растеризованную маску: заливка цветом по её альфа-каналу
+        pixmap = QPixmap(pixel_size, pixel_size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.drawImage(0, 0, mask)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), QColor(color))
+        painter.end()
+    else:
+        pixmap = QPixmap.fromImage(mask)
+    pixmap.setDevicePixelRatio(dpr)
+    QPixmapCache.insert(cache_key, pixmap)
+    
+    # Создаем иконку из пиксмапа
+    return QIcon(pixmap)
+
+
+# Иконки одноцветные (currentColor): SVG разбирается и растеризуется один раз на
+# сочетание (файл, размер), а цвет накладывается композицией поверх альфа-канала
+@lru_cache(maxsize=64)
+def _render_svg_mask(icon_name: str, size: int) -> Optional[QImage]:
+    """Растеризовать SVG иконку в изображение size x size (используется как альфа-маска)."""
+    svg_content = _read_svg_bytes(icon_name)
+    if svg_content is None:
+        return None
+    
+    try:
+        # Создаем рендерер SVG из исходного содержимого
+        renderer = QSvgRenderer(QByteArray(svg_content))
+        if not renderer.isValid():
+            print(f"Невалидный SVG файл: {icon_name}")
+            return None
+        
+        # Создаем изображение нужного размера
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        
+        # Рендерим SVG на изображение
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        renderer.render(painter)
+        painter.end()
+        return image
+    except Exception as e:
+        print(f"Ошибка загрузки иконки {icon_name}: {e}")
+        return None
+
+
 class _NoWheelComboBox(QComboBox):
     """Комбо-бокс без изменения значения колесом мыши, пока меню закрыто."""
 
@@ -66,6 +240,16 @@ class _StepsTableWidget(QTableWidget):
         self.setDragDropMode(QAbstractItemView.DropOnly)
         self.setDefaultDropAction(Qt.CopyAction)
         self._drag_over_row = -1  # Текущая строка, над которой происходит drag
+        self._drag_over_band: Optional[Tuple[int, int]] = None  # Границы этой строки по Y во viewport
+        # Подсветка строки при drag & drop: один полупрозрачный виджет поверх строки
+        # вместо временных items с фоном в каждой ячейке на каждое движение мыши
+        self._drop_overlay = QWidget(self.viewport())
+        self._drop_overlay.setStyleSheet("background-color: rgba(100, 150, 255, 120);")
+        self._drop_overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._drop_overlay.setAttribute(Qt.WA_StyledBackground)
+        self._drop_overlay.hide()
+        # При автопрокрутке во время drag строка остаётся той же, но смещается
+        self.verticalScrollBar().valueChanged.connect(self._place_drop_overlay)
         # Применяем стиль для обводки строки при drag & drop
         self.setStyleSheet("""
             QTableWidget::item {
@@ -85,6 +269,11 @@ class _StepsTableWidget(QTableWidget):
         """Обработка движения drag & drop."""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
+            # Событие приходит на каждое движение мыши: пока курсор в пределах
+            # подсвеченной строки, hit-test через indexAt не нужен
+            band = self._drag_over_band
+            if band is not None and band[0] <= event.pos().y() < band[1]:
+                return
             self._update_drag_over_row(event.pos())
         else:
             event.ignore()
@@ -98,40 +287,33 @@ class _StepsTableWidget(QTableWidget):
         """Обновить визуальное выделение строки при drag & drop."""
         row = self.indexAt(pos).row()
         if row != self._drag_over_row:
-            # Убираем выделение с предыдущей строки
-            self._clear_drag_over_row()
-            # Добавляем выделение новой строке
+            self._drag_over_row = row
             if row >= 0:
-                self._drag_over_row = row
-                # Применяем стиль выделения к строке через items (обводка вокруг всей строки)
-                # Используем более яркий цвет для лучшей видимости
-                highlight_color = QColor(100, 150, 255, 120)  # Более яркий полупрозрачный синий фон
-                for col in range(self.columnCount()):
-                    item = self.item(row, col)
-                    if not item:
-                        # Создаем временный item для стилизации, если его нет
-                        item = QTableWidgetItem()
-                        item.setFlags(Qt.NoItemFlags)  # Не редактируется
-                        self.setItem(row, col, item)
-                    # Применяем фон выделения (обводка вокруг всей строки)
-                    item.setBackground(highlight_color)
+                self._place_drop_overlay()
+            else:
+                self._drag_over_band = None
+                self._drop_overlay.hide()
+
+    @pyqtSlot()
+    def _place_drop_overlay(self):
+        """Расположить подсветку поверх строки, над которой идёт drag."""
+        row = self._drag_over_row
+        if row < 0:
+            return
+        top = self.rowViewportPosition(row)
+        height = self.rowHeight(row)
+        self._drag_over_band = (top, top + height)
+        overlay = self._drop_overlay
+        overlay.setGeometry(0, top, self.viewport().width(), height)
+        # Поверх виджетов ячеек, которые тоже лежат во viewport
+        overlay.raise_()
+        overlay.show()
     
     def _clear_drag_over_row(self):
         """Убрать визуальное выделение строки."""
+        self._drag_over_band = None
         if self._drag_over_row >= 0:
-            row = self._drag_over_row
-            # Убираем выделение строки
-            self.clearSelection()
-            # Убираем фон у всех items в строке
-            for col in range(self.columnCount()):
-                item = self.item(row, col)
-                if item:
-                    if item.flags() == Qt.NoItemFlags:
-                        # Удаляем временный item, если он был создан только для стилизации
-                        self.takeItem(row, col)
-                    else:
-                        # Убираем фон у существующего item
-                        item.setBackground(QColor())
+            self._drop_overlay.hide()
             self._drag_over_row = -1
     
     def dropEvent(self, event: QDropEvent):
@@ -173,215 +355,169 @@ class TestCaseFormWidget(QWidget):
     status_changed = pyqtSignal()  # Сигнал об изменении статуса шага
     file_attached_to_step = pyqtSignal()  # Сигнал о прикреплении файла к шагу
 
+    # Статусы шага в порядке кнопок: (значение, цвет, текст при отсутствии иконки)
+    _STATUS_SPEC = (
+        ("passed", "#2ecc71", "✓"),
+        ("failed", "#e74c3c", "✕"),
+        ("skipped", "#95a5a6", "S"),
+    )
+    # Строковый статус переводится в id один раз на входе; дальше - индексы в кортежах
+    _STATUS_IDS = {value: status_id for status_id, (value, _color, _text) in enumerate(_STATUS_SPEC)}
+    _STATUS_BUTTONS_QSS = _STATUS_BUTTON_QSS_BASE + "".join(
+        _STATUS_BUTTON_QSS_KIND.format(value=value, color=color) for value, color, _text in _STATUS_SPEC
+    )
+
+    # Кнопки управления шагом: (действие, текст без иконки, подсказка, обработчик строки)
+    _STEP_ACTION_SPEC = (
+        ("attach_file", "📎", "Прикрепить файл", "_attach_file_to_step"),
+        ("add_above", "+↑", "Добавить шаг выше", "_insert_step_above"),
+        ("add_below", "+↓", "Добавить шаг ниже", "_insert_step_below"),
+        ("move_up", "↑", "Переместить вверх", "_move_step_up"),
+        ("move_down", "↓", "Переместить вниз", "_move_step_down"),
+        ("delete", "×", "Удалить шаг", "_remove_step_by_row"),
+    )
+    # Размер иконок кнопок в ячейках шагов
+    _STEP_ICON_SIZE = QSize(16, 16)
+    # Минималистичные стили для кнопок действий (задаются таблице один раз,
+    # кнопки отмечены свойством stepAction)
+    _STEP_ACTION_BUTTON_QSS = """
+        QToolButton[stepAction] {
+            border: 1px solid transparent;
+            border-radius: 4px;
+            padding: 0px;
+            min-width: 24px;
+            max-width: 24px;
+            min-height: 24px;
+            max-height: 24px;
+            font-size: 12px;
+        }
+        QToolButton[stepAction]:hover {
+            background-color: rgba(255, 255, 255, 0.1);
+            border-color: rgba(255, 255, 255, 0.2);
+        }
+    """
+
     # Методы для работы с таблицей шагов в стиле TestOps
-    def _create_step_text_edit(self, placeholder: str) -> QTextEdit:
-        """Создать QTextEdit для редактирования шага."""
-        edit = QTextEdit()
+    def _create_step_text_edit(self, placeholder: str) -> QPlainTextEdit:
+        """Создать QPlainTextEdit для редактирования шага."""
+        edit = QPlainTextEdit()
         edit.setPlaceholderText(placeholder)
         edit.setWordWrapMode(QTextOption.WordWrap)
         edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
-        edit.setAcceptDrops(False)  # Отключаем drag & drop для QTextEdit, чтобы не вставлялся текст
-        edit.textChanged.connect(lambda: self._on_step_content_changed())
+        edit.setAcceptDrops(False)  # Отключаем drag & drop для QPlainTextEdit, чтобы не вставлялся текст
+        edit.textChanged.connect(self._on_step_content_changed)
         return edit
     
-    def _create_step_status_widget(self, row: int) -> QWidget:
+    def _create_step_status_widget(self) -> QWidget:
         """Создать виджет со статусами шага (вертикально расположенные минималистичные кнопки)."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(2, 2, 2, 2)
         layout.setSpacing(2)
         
+        # Одна группа на ячейку вместо отдельного обработчика на каждую кнопку;
+        # id кнопки - индекс статуса в _STATUS_SPEC
+        group = QButtonGroup(widget)
+        group.setExclusive(False)
         buttons = []
-        spec = [
-                ("passed", "#2ecc71"),
-                ("failed", "#e74c3c"),
-                ("skipped", "#95a5a6"),
-            ]
-        for value, color in spec:
+        icon_size = self._STEP_ICON_SIZE
+        for status_id, ((value, _color, fallback_text), (icon, _active_icon)) in enumerate(
+            zip(self._STATUS_SPEC, self._get_status_button_icons())
+        ):
             btn = QToolButton()
             
-            # Загружаем иконку из маппинга с цветом статуса (для неактивного состояния)
-            icon_name = self._get_status_icon(value)
-            if icon_name:
-                # Сохраняем имя иконки для последующей перезагрузки
-                btn.setProperty("icon_name", icon_name)
-                # Загружаем иконку с цветом статуса для неактивного состояния
-                icon = self._load_svg_icon(icon_name, size=16, color=color)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(16, 16))
-                else:
-                    # Fallback на текст, если иконка не загрузилась
-                    fallback_text = {"passed": "✓", "failed": "✕", "skipped": "S"}.get(value, "?")
-                    btn.setText(fallback_text)
+            # Иконка с цветом статуса (неактивное состояние)
+            if icon:
+                btn.setIcon(icon)
+                btn.setIconSize(icon_size)
             else:
-                # Fallback на текст, если иконка не найдена в маппинге
-                fallback_text = {"passed": "✓", "failed": "✕", "skipped": "S"}.get(value, "?")
+                # Fallback на текст, если иконка не найдена или не загрузилась
                 btn.setText(fallback_text)
             
+            btn.setProperty("statusKind", value)
+            btn.setProperty("statusActive", False)
             btn.setCheckable(True)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setAutoRaise(True)
             btn.setFixedSize(24, 24)  # Компактный размер для вертикального расположения
-            btn.setProperty("status_value", value)
-            btn.setProperty("status_color", color)
-            btn.clicked.connect(lambda _checked, val=value, r=row: self._on_step_status_clicked(r, val))
+            group.addButton(btn, status_id)
             layout.addWidget(btn)
             buttons.append(btn)
+        group.idClicked.connect(self._on_step_status_button_clicked)
         
         layout.addStretch()  # Растягиваем пространство, чтобы кнопки были сверху
-        # Видимость управляется через скрытие/показ колонки, а не виджета
-        widget.setProperty("status_buttons", buttons)
+        # Видимость управляется через скрытие/показ колонки, а не виджета.
+        # Кнопки и применённый статус храним атрибутами Python, без QVariant
+        widget._status_buttons = buttons
+        widget._applied_status_id = -1  # Все кнопки уже оформлены как неактивные (pending)
+        widget._status = "pending"  # Статус шага хранится только в виджете ячейки
         return widget
     
-    def _create_step_actions_widget(self, row: int) -> QWidget:
+    def _create_step_actions_widget(self) -> QWidget:
         """Создать виджет с кнопками управления шагом (вертикально расположенные минималистичные кнопки)."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(2, 2, 2, 2)
         layout.setSpacing(2)
         
-        # Минималистичные стили для кнопок действий
-        action_button_style = """
-            QToolButton {
-                border: 1px solid transparent;
-                border-radius: 4px;
-                padding: 0px;
-                min-width: 24px;
-                max-width: 24px;
-                min-height: 24px;
-                max-height: 24px;
-                font-size: 12px;
-            }
-            QToolButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-color: rgba(255, 255, 255, 0.2);
-            }
-        """
-        
-        # Кнопка прикрепления файла - первая в списке
-        attach_file_btn = QToolButton()
-        icon_name = self._get_step_action_icon("attach_file")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-            if icon:
-                attach_file_btn.setIcon(icon)
-                attach_file_btn.setIconSize(QSize(16, 16))
-            else:
-                attach_file_btn.setText("📎")
-        else:
-            attach_file_btn.setText("📎")
-        attach_file_btn.setToolTip("Прикрепить файл")
-        attach_file_btn.setCursor(Qt.PointingHandCursor)
-        attach_file_btn.setAutoRaise(True)
-        attach_file_btn.setFixedSize(24, 24)
-        attach_file_btn.setStyleSheet(action_button_style)
-        attach_file_btn.clicked.connect(lambda: self._attach_file_to_step(row))
-        layout.addWidget(attach_file_btn)
-        
-        add_above_btn = QToolButton()
-        icon_name = self._get_step_action_icon("add_above")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-            if icon:
-                add_above_btn.setIcon(icon)
-                add_above_btn.setIconSize(QSize(16, 16))
-            else:
-                add_above_btn.setText("+↑")
-        else:
-            add_above_btn.setText("+↑")
-        add_above_btn.setToolTip("Добавить шаг выше")
-        add_above_btn.setCursor(Qt.PointingHandCursor)
-        add_above_btn.setAutoRaise(True)
-        add_above_btn.setFixedSize(24, 24)
-        add_above_btn.setStyleSheet(action_button_style)
-        add_above_btn.clicked.connect(lambda: self._insert_step_above(row))
-        layout.addWidget(add_above_btn)
-        
-        add_below_btn = QToolButton()
-        icon_name = self._get_step_action_icon("add_below")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-            if icon:
-                add_below_btn.setIcon(icon)
-                add_below_btn.setIconSize(QSize(16, 16))
-            else:
-                add_below_btn.setText("+↓")
-        else:
-            add_below_btn.setText("+↓")
-        add_below_btn.setToolTip("Добавить шаг ниже")
-        add_below_btn.setCursor(Qt.PointingHandCursor)
-        add_below_btn.setAutoRaise(True)
-        add_below_btn.setFixedSize(24, 24)
-        add_below_btn.setStyleSheet(action_button_style)
-        add_below_btn.clicked.connect(lambda: self._insert_step_below(row))
-        layout.addWidget(add_below_btn)
-        
-        move_up_btn = QToolButton()
-        icon_name = self._get_step_action_icon("move_up")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-            if icon:
-                move_up_btn.setIcon(icon)
-                move_up_btn.setIconSize(QSize(16, 16))
-            else:
-                move_up_btn.setText("↑")
-        else:
-            move_up_btn.setText("↑")
-        move_up_btn.setToolTip("Переместить вверх")
-        move_up_btn.setCursor(Qt.PointingHandCursor)
-        move_up_btn.setAutoRaise(True)
-        move_up_btn.setFixedSize(24, 24)
-        move_up_btn.setStyleSheet(action_button_style)
-        move_up_btn.clicked.connect(lambda: self._move_step_up(row))
-        layout.addWidget(move_up_btn)
-        
-        move_down_btn = QToolButton()
-        icon_name = self._get_step_action_icon("move_down")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-            if icon:
-                move_down_btn.setIcon(icon)
-                move_down_btn.setIconSize(QSize(16, 16))
-            else:
-                move_down_btn.setText("↓")
-        else:
-            move_down_btn.setText("↓")
-        move_down_btn.setToolTip("Переместить вниз")
-        move_down_btn.setCursor(Qt.PointingHandCursor)
-        move_down_btn.setAutoRaise(True)
-        move_down_btn.setFixedSize(24, 24)
-        move_down_btn.setStyleSheet(action_button_style)
-        move_down_btn.clicked.connect(lambda: self._move_step_down(row))
-        layout.addWidget(move_down_btn)
-        
-        remove_btn = QToolButton()
-        icon_name = self._get_step_action_icon("delete")
-        if icon_name:
-            icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
+        # Как и у статусов: одна группа на ячейку, id кнопки - индекс действия
+        # в _STEP_ACTION_SPEC, строка определяется в момент клика
+        group = QButtonGroup(widget)
+        buttons = []
+        icon_size = self._STEP_ICON_SIZE
+        for action_id, ((_action, fallback_text, tooltip, _handler), icon) in enumerate(
+            zip(self._STEP_ACTION_SPEC, self._get_step_action_icons())
+        ):
+            btn = QToolButton()
             if icon:
-                remove_btn.setIcon(icon)
-                remove_btn.setIconSize(QSize(16, 16))
+                btn.setIcon(icon)
+                btn.setIconSize(icon_size)
             else:
-                remove_btn.setText("×")
-        else:
-            remove_btn.setText("×")
-        remove_btn.setToolTip("Удалить шаг")
-        remove_btn.setCursor(Qt.PointingHandCursor)
-        remove_btn.setAutoRaise(True)
-        remove_btn.setFixedSize(24, 24)
-        remove_btn.setStyleSheet(action_button_style)
-        remove_btn.clicked.connect(lambda: self._remove_step_by_row(row))
-        layout.addWidget(remove_btn)
+                btn.setText(fallback_text)
+            btn.setToolTip(tooltip)
+            btn.setProperty("stepAction", True)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setAutoRaise(True)
+            btn.setFixedSize(24, 24)
+            group.addButton(btn, action_id)
+            layout.addWidget(btn)
+            buttons.append(btn)
+        group.idClicked.connect(self._on_step_action_button_clicked)
         
         layout.addStretch()  # Растягиваем пространство, чтобы кнопки были сверху
         
         # Видимость управляется через скрытие/показ колонки, а не виджета
-        widget.setProperty("move_up_btn", move_up_btn)
-        widget.setProperty("move_down_btn", move_down_btn)
+        widget._move_up_btn = buttons[3]
+        widget._move_down_btn = buttons[4]
         return widget
+
+    def _get_status_button_icons(self) -> List[Tuple[Optional[QIcon], Optional[QIcon]]]:
+        """Иконки кнопок статуса (неактивная, активная) в порядке _STATUS_SPEC (общие для всех строк)."""
+        if self._status_button_icons is None:
+            icons = []
+            for value, color, _fallback_text in self._STATUS_SPEC:
+                icon_name = self._get_status_icon(value)
+                if icon_name:
+                    icons.append((
+                        self._load_svg_icon(icon_name, size=16, color=color),
+                        self._load_svg_icon(icon_name, size=16, color="#ffffff"),
+                    ))
+                else:
+                    icons.append((None, None))
+            self._status_button_icons = icons
+        return self._status_button_icons
+
+    def _get_step_action_icons(self) -> List[Optional[QIcon]]:
+        """Иконки кнопок управления шагом в порядке _STEP_ACTION_SPEC (общие для всех строк)."""
+        if self._step_action_icons is None:
+            icons = []
+            for action, _fallback_text, _tooltip, _handler in self._STEP_ACTION_SPEC:
+                icon_name = self._get_step_action_icon(action)
+                icons.append(self._load_svg_icon(icon_name, size=16, color="#ffffff") if icon_name else None)
+            self._step_action_icons = icons
+        return self._step_action_icons
     
     class SkipReasonDialog(QDialog):
         """Диалог для выбора причины пропуска тест-кейса"""
@@ -465,6 +601,12 @@ class TestCaseFormWidget(QWidget):
                 if self.ok_button:
                     self.ok_button.setEnabled(False)
         
+        def reset(self):
+            """Сбросить выбор перед повторным показом диалога."""
+            self.reason_combo.setCurrentIndex(0)
+            self.comment_edit.clear()
+            self._update_ok_button()
+        
         def get_skip_reason(self) -> str:
             """Получить причину пропуска"""
             reason = self.reason_combo.currentText().strip()
@@ -478,12 +620,41 @@ class TestCaseFormWidget(QWidget):
                 # Если выбрана другая причина, возвращаем её значение
                 return reason
     
+    def _sender_cell_row(self) -> int:
+        """Строка таблицы шагов, в ячейке которой находится группа кнопок-отправитель.
+
+        Строка берётся из положения ячейки, а не из словаря виджет -> строка: такой словарь
+        пришлось бы перестраивать при каждой вставке, удалении и перемещении шагов.
+        rowAt - двоичный поиск по секциям вертикального заголовка, без построения QModelIndex.
+        """
+        group = self.sender()
+        cell_widget = group.parent() if group else None
+        if cell_widget is None:
+            return -1
+        return self.steps_table.rowAt(cell_widget.y())
+
+    @pyqtSlot(int)
+    def _on_step_status_button_clicked(self, status_id: int):
+        """Обработчик группы кнопок статуса: строка определяется по положению ячейки в таблице."""
+        row = self._sender_cell_row()
+        if row < 0:
+            return
+        self._on_step_status_clicked(row, self._STATUS_SPEC[status_id][0])
+
+    @pyqtSlot(int)
+    def _on_step_action_button_clicked(self, action_id: int):
+        """Обработчик группы кнопок управления шагом."""
+        row = self._sender_cell_row()
+        if row < 0:
+            return
+        getattr(self, self._STEP_ACTION_SPEC[action_id][3])(row)
+
     def _on_step_status_clicked(self, row: int, status: str):
         """Обработчик клика по статусу шага."""
         try:
-            if row < 0 or row >= len(self.step_statuses):
+            if row < 0 or row >= self.steps_table.rowCount():
                 return
-            if self.step_statuses[row] == status:
+            if self._get_step_status(row) == status:
                 return
             
             # Если выбран статус "skipped", показываем диалог выбора причины
@@ -492,16 +663,13 @@ class TestCaseFormWidget(QWidget):
                 if skip_reason is None:  # Пользователь отменил диалог
                     return
                 # Устанавливаем статус и причину
-                self.step_statuses[row] = status
                 self._update_step_status_widget(row, status)
                 if self.current_test_case and row < len(self.current_test_case.steps):
                     step = self.current_test_case.steps[row]
                     step.status = status
                     step.skip_reason = skip_reason or ""  # Убеждаемся, что это строка
-                self._auto_save_status_change()
             else:
                 # Для других статусов работаем как раньше
-                self.step_statuses[row] = status
                 self._update_step_status_widget(row, status)
                 if self.current_test_case and row < len(self.current_test_case.steps):
                     step = self.current_test_case.steps[row]
@@ -509,12 +677,13 @@ class TestCaseFormWidget(QWidget):
                     # Очищаем skipReason при изменении статуса на failed или passed
                     if status in ("failed", "passed"):
                         step.skip_reason = ""
-                self._auto_save_status_change()
-            
-            self._update_statistics()  # Обновляем статистику при изменении статуса
-            # Эмитируем сигнал для обновления статистики в главном окне
-            if hasattr(self, 'status_changed'):
-                self.status_changed.emit()
+
+            if self._bulk_status_update:
+                # Массовая операция сохраняет и оповещает один раз по завершении
+                return
+            self._auto_save_status_change()
+            # Статистика и главное окно обновляются один раз на серию кликов
+            self._status_notify_timer.start()
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Произошла ошибка при изменении статуса шага: {str(e)}")
     
@@ -526,7 +695,15 @@ class TestCaseFormWidget(QWidget):
             if not skip_reasons:
                 skip_reasons = ['Автотесты', 'Нагрузочное тестирование', 'Другое']
             
-            dialog = self.SkipReasonDialog(self, skip_reasons)
+            # Диалог строится один раз и переиспользуется; пересоздаём его,
+            # только если список причин поменялся
+            dialog = self._skip_dialog
+            if dialog is None or dialog.skip_reasons != skip_reasons:
+                if dialog is not None:
+                    dialog.deleteLater()
+                dialog = self._skip_dialog = self.SkipReasonDialog(self, list(skip_reasons))
+            else:
+                dialog.reset()
             if dialog.exec_() == QDialog.Accepted:
                 return dialog.get_skip_reason()
             return None
@@ -534,89 +711,110 @@ class TestCaseFormWidget(QWidget):
             QMessageBox.critical(self, "Ошибка", f"Произошла ошибка при открытии диалога выбора причины: {str(e)}")
             return None
     
+    def _get_step_status(self, row: int) -> str:
+        """Статус шага в указанной строке."""
+        return self._step_cells[row][2]._status
+
     def _update_step_status_widget(self, row: int, status: str):
         """Обновить виджет статуса для указанной строки."""
-        status_widget = self.steps_table.cellWidget(row, 3)
-        if not status_widget:
+        status_widget = self._step_cells[row][2]
+        buttons = status_widget._status_buttons
+        active_id = self._STATUS_IDS.get(status, -1)  # -1: ни одна кнопка не активна (pending)
+        applied_id = status_widget._applied_status_id
+        if status == status_widget._status and active_id == applied_id:
+            # Ячейка уже показывает этот статус (переиспользованная строка, повторная установка)
             return
-        buttons = status_widget.property("status_buttons")
-        if not buttons:
-            return
-        for btn in buttons:
-            value = btn.property("status_value")
-            color = btn.property("status_color") or "#4CAF50"
-            is_active = value == status
+        status_widget._status = status
+        icon_size = self._STEP_ICON_SIZE
+        for status_id, (btn, icons) in enumerate(zip(buttons, self._get_status_button_icons())):
+            is_active = status_id == active_id
             btn.setChecked(is_active)
+            if is_active == (status_id == applied_id):
+                # Иконка и стиль кнопки уже соответствуют её состоянию
+                continue
             
-            # Перезагружаем иконку в зависимости от состояния
-            icon_name = btn.property("icon_name")
-            if icon_name:
-                if is_active:
-                    # Для активного состояния: белая иконка
-                    icon = self._load_svg_icon(icon_name, size=16, color="#ffffff")
-                else:
-                    # Для неактивного состояния: иконка с цветом статуса
-                    icon = self._load_svg_icon(icon_name, size=16, color=color)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(16, 16))
+            # Активное состояние - белая иконка, неактивное - иконка с цветом статуса
+            icon = icons[is_active]
+            if icon:
+                btn.setIcon(icon)
+                btn.setIconSize(icon_size)
             
-            if is_active:
-                # Активное состояние: цветной фон, белая иконка, без рамки
-                btn.setStyleSheet(
-                    f"""
-                    QToolButton {{
-                        background-color: {color};
-                        border: none;
-                        border-radius: 4px;
-                        padding: 0px;
-                        min-width: 24px;
-                        max-width: 24px;
-                        min-height: 24px;
-                        max-height: 24px;
-                    }}
-                    """
-                )
-            else:
-                # Неактивное состояние: без рамки, прозрачный фон, иконка с цветом статуса
-                btn.setStyleSheet(
-                    f"""
-                    QToolButton {{
-                        background-color: transparent;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 0px;
-                        min-width: 24px;
-                        max-width: 24px;
-                        min-height: 24px;
-                        max-height: 24px;
-                    }}
-                    QToolButton:hover {{
-                        background-color: {color}33;
-                    }}
-                    """
-                )
-
+            # Таблица стилей уже разобрана: достаточно сменить свойство и переприменить стиль
+            btn.setProperty("statusActive", is_active)
+            style = btn.style()
+            style.unpolish(btn)
+            style.polish(btn)
+        status_widget._applied_status_id = active_id
+
+    @pyqtSlot()
     def _on_step_content_changed(self):
         """Обработчик изменения содержимого шага."""
         if self._is_loading:
             return
-        # Обновляем высоту всех строк таблицы для корректного отображения
-        QTimer.singleShot(0, self._update_table_row_heights)
+        # Высоту строки пересчитываем после паузы во вводе, а не на каждое нажатие клавиши;
+        # флаг изменений выставляется сразу, чтобы сохранение не разошлось с ним
+        edit = self.sender()
+        if edit is not None:
+            self._pending_content_edits.add(edit)
+            self._content_change_timer.start()
         self._mark_changed()
+
+    @pyqtSlot()
+    def _flush_pending_content_changes(self):
+        """Пересчитать высоту строк, в которых менялся текст шагов."""
+        edits = self._pending_content_edits
+        if not edits:
+            return
+        self._pending_content_edits = set()
+        # Размер ячеек не зависит от остальных строк: пересчитываем только изменённые
+        steps_table = self.steps_table
+        for edit in edits:
+            row = steps_table.rowAt(edit.y())
+            if row >= 0:
+                steps_table.resizeRowToContents(row)
     
     def _update_table_row_heights(self):
         """Обновить высоты всех строк таблицы."""
-        for row in range(self.steps_table.rowCount()):
-            self.steps_table.resizeRowToContents(row)
-        # Также обновляем ширину колонки с номером
-        self.steps_table.resizeColumnToContents(0)
+        steps_table = self.steps_table
+        resize_row = steps_table.resizeRowToContents
+        for row in range(steps_table.rowCount()):
+            resize_row(row)
     
 
     # Сигналы
     test_case_saved = pyqtSignal()
     unsaved_changes_state = pyqtSignal(bool)
     before_save = pyqtSignal(object)  # Сигнал перед сохранением с передачей тест-кейса
+
+    # Пункты контекстного меню таблицы шагов: (ключ, текст, обработчик)
+    _STEPS_MENU_SPEC = (
+        ("add_new", "➕ Добавить новый шаг", "_add_step_to_end"),
+        ("insert_above", "↑ Вставить шаг выше", "_insert_step_above"),
+        ("insert_below", "↓ Вставить шаг ниже", "_insert_step_below"),
+        ("move_up", "⇡ Переместить наверх", "_move_step_up"),
+        ("move_down", "⇣ Переместить вниз", "_move_step_down"),
+        ("remove", "✕ Удалить", "_remove_step"),
+    )
+
+    # Повторы автосохранения статусов при ошибке записи
+    _AUTO_SAVE_MAX_RETRIES = 3
+    _AUTO_SAVE_RETRY_DELAY_MS = 1000
+    # Окно, в котором клики по статусам объединяются в одно автосохранение
+    _AUTO_SAVE_DEBOUNCE_MS = 400
+    # Задержка пересчёта высоты автоподстраиваемых полей (один кадр)
+    _AUTO_RESIZE_DEBOUNCE_MS = 16
+    # Пауза во вводе текста шага, после которой пересчитывается высота строки
+    _CONTENT_CHANGE_DEBOUNCE_MS = 150
+    # Пауза между кликами по статусам, после которой обновляется статистика и главное окно
+    _STATUS_NOTIFY_DEBOUNCE_MS = 150
+    # Текст статистики по шагам в режиме запуска
+    _STATS_TEXT_TEMPLATE = (
+        "<b>Статистика по шагам:</b><br>"
+        "Всего: {total} | "
+        "Пройдено: <span style='color: #6CC24A;'>{passed}</span> | "
+        "Осталось: <span style='color: #FFA931;'>{pending}</span> | "
+        "Не пройдено: <span style='color: #F5555D;'>{not_passed}</span>"
+    )
     
     def __init__(self, service: TestCaseService, parent=None):
         super().__init__(parent)
@@ -626,63 +824,50 @@ class TestCaseFormWidget(QWidget):
         self._is_loading = False
         self._edit_mode_enabled = True
         self._run_mode_enabled = False
-        self.step_statuses: List[str] = []
         self._step_attachments: List[List[str]] = []  # Список attachments для каждого шага
         self._skip_reasons: List[str] = ['Автотесты', 'Нагрузочное тестирование', 'Другое']  # Значения по умолчанию
+        self._skip_dialog: Optional[TestCaseFormWidget.SkipReasonDialog] = None
+        self._ui_built = False  # См. set_skip_reasons
+        self._auto_save_retries = 0
+        self._auto_save_timer = QTimer(self)
+        self._auto_save_timer.setSingleShot(True)
+        self._auto_save_timer.setInterval(self._AUTO_SAVE_DEBOUNCE_MS)
+        self._auto_save_timer.timeout.connect(self._do_auto_save)
+        self._bulk_status_update = False
+        self._auto_resize_timers: List[QTimer] = []
+        # Виджеты ячеек каждой строки шагов (действие, ожидаемый результат, статус, кнопки)
+        # в порядке строк: обход без cellWidget на каждую ячейку
+        self._step_cells: List[Tuple[QPlainTextEdit, QPlainTextEdit, QWidget, QWidget]] = []
+        # Перенумерация шагов откладывается до конца текущей итерации цикла событий:
+        # серия вставок/удалений подряд даёт один проход с наименьшей затронутой строки
+        self._pending_index_row: Optional[int] = None
+        self._index_column_digits = 0  # Число разрядов, под которое подогнана колонка №
+        self._step_indices_timer = QTimer(self)
+        self._step_indices_timer.setSingleShot(True)
+        self._step_indices_timer.setInterval(0)
+        self._step_indices_timer.timeout.connect(self._flush_step_indices)
+        # Редакторы шагов, в которых менялся текст с последнего пересчёта высоты строк
+        self._pending_content_edits = set()
+        self._content_change_timer = QTimer(self)
+        self._content_change_timer.setSingleShot(True)
+        self._content_change_timer.setInterval(self._CONTENT_CHANGE_DEBOUNCE_MS)
+        self._content_change_timer.timeout.connect(self._flush_pending_content_changes)
+        # Изменение статуса пересчитывает статистику формы, а status_changed в главном
+        # окне обновляет дерево, отчёты и статусбар: серия кликов даёт одно обновление
+        self._status_notify_timer = QTimer(self)
+        self._status_notify_timer.setSingleShot(True)
+        self._status_notify_timer.setInterval(self._STATUS_NOTIFY_DEBOUNCE_MS)
+        self._status_notify_timer.timeout.connect(self._flush_status_change)
+        self._step_action_icons: Optional[List[Optional[QIcon]]] = None  # См. _get_step_action_icons
+        self._status_button_icons: Optional[List[Tuple[Optional[QIcon], Optional[QIcon]]]] = None
+        self._pending_focus_row: Optional[int] = None  # См. _scroll_to_step_and_focus
+        self._steps_menu: Optional[QMenu] = None  # Создаётся при первом вызове контекстного меню
+        self._steps_menu_actions: Dict[str, QAction] = {}
+        self.bulk_operations_group: Optional[QGroupBox] = None  # Создаётся при первом включении режима запуска
         
         # Загружаем маппинг иконок
-        self._icon_mapping = self._load_icon_mapping()
+        self._icon_mapping = _get_icon_mapping()
     
-    def _load_icon_mapping(self) -> Dict[str, Dict[str, str]]:
-        """Загрузить маппинг иконок из JSON файла."""
-        # Определяем путь к файлу маппинга относительно корня проекта
-        project_root = Path(__file__).parent.parent.parent.parent
-        mapping_file = project_root / "icons" / "icon_mapping.json"
-        
-        if mapping_file.exists():
-            try:
-                with open(mapping_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Поддерживаем как старый формат (плоский), так и новый (с секциями)
-                    if isinstance(data, dict) and any(key in data for key in ['panels', 'context_menu', 'panel_buttons', 'status_icons', 'bulk_operations', 'step_actions']):
-                        return data
-                    else:
-                        # Старый формат - возвращаем с секциями
-                        return {
-                            'panels': data if isinstance(data, dict) else {},
-                            'context_menu': {},
-                            'panel_buttons': {},
-                            'status_icons': {},
-                            'bulk_operations': {},
-                            'step_actions': {}
-                        }
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Ошибка загрузки маппинга иконок: {e}")
-        
-        # Возвращаем значения по умолчанию, если файл не найден
-        return {
-            'panels': {},
-            'context_menu': {},
-            'panel_buttons': {},
-            'status_icons': {
-                "passed": "check-circle.svg",
-                "failed": "x-circle.svg",
-                "skipped": "skip-forward.svg"
-            },
-            'bulk_operations': {
-                "mark_all_passed": "fast-forward.svg",
-                "reset_statuses": "refresh-ccw.svg"
-            },
-            'step_actions': {
-                "attach_file": "file.svg",
-                "add_above": "corner-up-left.svg",
-                "add_below": "corner-down-left.svg",
-                "move_up": "chevron-up.svg",
-                "move_down": "chevron-down.svg",
-                "delete": "x.svg"
-            }
-        }
-
     def _get_status_icon(self, status: str) -> Optional[str]:
         """Получить имя файла иконки для статуса по ключу."""
         status_icons_mapping = self._icon_mapping.get('status_icons', {})
@@ -706,93 +891,119 @@ class TestCaseFormWidget(QWidget):
             size: Размер иконки в пикселях
             color: Цвет иконки в формате "#RRGGBB" или None для использования цвета по умолчанию
         """
-        # Определяем путь к папке с иконками относительно корня проекта
-        project_root = Path(__file__).parent.parent.parent.parent
-        icon_path = project_root / "icons" / icon_name
-        
-        if not icon_path.exists():
-            print(f"Иконка не найдена: {icon_path}")
-            return None
-        
-        try:
-            # Читаем содержимое SVG файла
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
-            
-            # Если указан цвет, заменяем currentColor на конкретный цвет
-            if color:
-                svg_content = svg_content.replace('currentColor', color)
-                svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-                svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
-            
-            # Создаем рендерер SVG из модифицированного содержимого
-            renderer = QSvgRenderer(svg_content.encode('utf-8'))
-            if not renderer.isValid():
-                print(f"Невалидный SVG файл: {icon_path}")
-                return None
-            
-            # Создаем пиксмап нужного размера
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.transparent)
-            
-            # Рендерим SVG на пиксмап
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            renderer.render(painter)
-            painter.end()
-            
-            # Создаем иконку из пиксмапа
-            icon = QIcon(pixmap)
-            return icon
-        except Exception as e:
-            print(f"Ошибка загрузки иконки {icon_name}: {e}")
-            return None
+        return _render_svg_icon(icon_name, size, color, self.devicePixelRatioF())
     
     def set_skip_reasons(self, reasons: List[str]):
         """Установить список причин пропуска из настроек"""
         if reasons and isinstance(reasons, list):
             self._skip_reasons = reasons
 
-        self.setup_ui()
+        # Форма строится при первой передаче настроек. Причины пропуска нужны только
+        # диалогу, а он сам пересоздаётся при их изменении: повторно форму не строим
+        if not self._ui_built:
+            self.setup_ui()
 
-    def _init_auto_resizing_text_edit(self, text_edit: QTextEdit, *, min_lines: int = 3, max_lines: int = 12):
-        """Настроить QTextEdit так, чтобы он подстраивал высоту под содержимое."""
+    def _init_auto_resizing_text_edit(self, text_edit: QPlainTextEdit, *, min_lines: int = 3, max_lines: int = 12):
+        """Настроить QPlainTextEdit так, чтобы он подстраивал высоту под содержимое."""
         text_edit.setWordWrapMode(QTextOption.WordWrap)
         text_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        min_height = self._calculate_text_edit_height(text_edit, min_lines)
-        max_height = self._calculate_text_edit_height(text_edit, max_lines)
-        text_edit.setMinimumHeight(min_height)
-        text_edit.setMaximumHeight(max_height)
+        # Границы высоты зависят только от шрифта: считаем их один раз и
+        # пересчитываем по QEvent.FontChange (см. eventFilter)
+        # bounds: высота строки, поля документа, минимальная и максимальная высота
+        bounds = [0, 0, 0, 0]
+        # Число строк при последнем пересчёте: высота меняется только вместе с ним
+        last_line_count = [-1]
+
+        def _update_bounds():
+            line_height, overhead = self._calculate_text_edit_metrics(text_edit)
+            min_height = int(min_lines * line_height + overhead + 8)
+            max_height = int(max_lines * line_height + overhead + 8)
+            bounds[:] = [line_height, overhead, min_height, max_height]
+            text_edit.setMinimumHeight(min_height)
+            text_edit.setMaximumHeight(max_height)
+            last_line_count[0] = -1
 
         def _resize():
-            self._auto_resize_text_edit(text_edit, min_height, max_height)
-
-        text_edit.textChanged.connect(_resize)
+            if self._is_loading:
+                return
+            # У QPlainTextEdit высота документа измеряется в строках
+            line_count = text_edit.document().size().height()
+            if line_count == last_line_count[0]:
+                return
+            last_line_count[0] = line_count
+            self._auto_resize_text_edit(text_edit, line_count, *bounds)
+
+        # Серия textChanged (ввод, вставка, загрузка) схлопывается в один пересчёт высоты
+        resize_timer = QTimer(text_edit)
+        resize_timer.setSingleShot(True)
+        resize_timer.setInterval(self._AUTO_RESIZE_DEBOUNCE_MS)
+        resize_timer.timeout.connect(_resize)
+        text_edit.textChanged.connect(resize_timer.start)
+        self._auto_resize_timers.append(resize_timer)
+
+        def _on_font_change():
+            _update_bounds()
+            resize_timer.start()
+
+        _update_bounds()
+        text_edit._on_font_change = _on_font_change
+        text_edit.installEventFilter(self)
         QTimer.singleShot(0, _resize)
 
+    def _schedule_auto_resize(self):
+        """Пересчитать высоту всех автоподстраиваемых полей после загрузки."""
+        for timer in self._auto_resize_timers:
+            timer.start()
+
     @staticmethod
-    def _calculate_text_edit_height(text_edit: QTextEdit, lines: int) -> int:
-        metrics = text_edit.fontMetrics()
-        line_height = metrics.lineSpacing()
+    def _calculate_text_edit_metrics(text_edit: QPlainTextEdit) -> Tuple[int, float]:
+        """Вычислить высоту строки и вертикальные поля TextEdit за один запрос метрик шрифта."""
         margins = text_edit.contentsMargins()
-        doc_margin = text_edit.document().documentMargin()
-        return int(lines * line_height + doc_margin * 2 + margins.top() + margins.bottom() + 8)
+        overhead = text_edit.document().documentMargin() * 2 + margins.top() + margins.bottom()
+        return text_edit.fontMetrics().lineSpacing(), overhead
+
+    def eventFilter(self, obj, event):
+        """Пересчитать границы высоты автоподстраиваемых полей при смене шрифта."""
+        if event.type() == QEvent.FontChange:
+            on_font_change = getattr(obj, '_on_font_change', None)
+            if on_font_change:
+                on_font_change()
+        return super().eventFilter(obj, event)
 
     @staticmethod
-    def _auto_resize_text_edit(text_edit: QTextEdit, min_height: int, max_height: int):
-        doc = text_edit.document()
-        margins = text_edit.contentsMargins()
-        doc_height = doc.size().height() + doc.documentMargin() * 2 + margins.top() + margins.bottom() + 6
-        new_height = max(min_height, min(max_height, int(doc_height)))
+    def _auto_resize_text_edit(
+        text_edit: QPlainTextEdit,
+        line_count: float,
+        line_height: int,
+        overhead: float,
+        min_height: int,
+        max_height: int,
+    ):
+        new_height = max(min_height, min(max_height, int(line_count * line_height + overhead + 6)))
         if text_edit.height() != new_height:
             text_edit.setFixedHeight(new_height)
     
     def setup_ui(self):
         """Настройка UI"""
+        # Пока создаются группы, форма не перерисовывается; одна перерисовка в конце
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_form()
+        finally:
+            self.setUpdatesEnabled(True)
+        self._ui_built = True
+        self.updateGeometry()
+
+    def _build_form(self):
+        """Создать прокручиваемую форму со всеми группами."""
+        base_spacing = UI_METRICS.base_spacing
+        section_spacing = UI_METRICS.section_spacing
+        container_padding = UI_METRICS.container_padding
+        self._auto_resize_timers = []
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(UI_METRICS.base_spacing)
+        layout.setSpacing(base_spacing)
         
         # Scrollable форма
         scroll = QScrollArea()
@@ -801,12 +1012,12 @@ class TestCaseFormWidget(QWidget):
         
         form_widget = QWidget()
         form_layout = QVBoxLayout(form_widget)
-        form_layout.setSpacing(UI_METRICS.section_spacing)
+        form_layout.setSpacing(section_spacing)
         form_layout.setContentsMargins(
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
+            container_padding,
+            container_padding,
+            container_padding,
+            container_padding,
         )
         
         # Название тест-кейса
@@ -817,15 +1028,17 @@ class TestCaseFormWidget(QWidget):
         precond_group = self._create_precondition_group()
         form_layout.addWidget(precond_group)
 
-        # Массовые операции (только в режиме запуска тестов)
-        self.bulk_operations_group = self._create_bulk_operations_group()
-        self.bulk_operations_group.setVisible(False)
-        form_layout.addWidget(self.bulk_operations_group)
+        # Массовые операции (только в режиме запуска тестов): группа создаётся
+        # при первом включении режима запуска, здесь запоминаем её место
+        self.bulk_operations_group = None
+        self._form_layout = form_layout
+        self._bulk_operations_index = form_layout.count()
 
         # Шаги тестирования
         steps_group = self._create_steps_group()
         steps_group.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         form_layout.addWidget(steps_group, 1)
+        self.steps_group = steps_group  # Сохраняем ссылку для прокрутки к шагам
         
         form_layout.addStretch()
 
@@ -930,7 +1143,7 @@ class TestCaseFormWidget(QWidget):
         layout.setContentsMargins(10, UI_METRICS.group_title_spacing, 10, 8)  # Отступ сверху для заголовка
         layout.setSpacing(6)
 
-        self.tags_input = QTextEdit()
+        self.tags_input = QPlainTextEdit()
         self.tags_input.setPlaceholderText("Введите теги, каждый с новой строки")
         self.tags_input.textChanged.connect(self._mark_changed)
         self._init_auto_resizing_text_edit(self.tags_input, min_lines=2, max_lines=10)
@@ -943,7 +1156,7 @@ class TestCaseFormWidget(QWidget):
         layout.setContentsMargins(10, UI_METRICS.group_title_spacing, 10, 8)  # Отступ сверху для заголовка
         layout.setSpacing(6)
 
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setPlaceholderText("Подробное описание тест-кейса")
         self.description_input.textChanged.connect(self._mark_changed)
         self._init_auto_resizing_text_edit(self.description_input, min_lines=4, max_lines=12)
@@ -993,7 +1206,7 @@ class TestCaseFormWidget(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, UI_METRICS.group_title_spacing, 0, 0)  # Отступ сверху для заголовка
         
-        self.precondition_input = QTextEdit()
+        self.precondition_input = QPlainTextEdit()
         self.precondition_input.setPlaceholderText("Предусловия для выполнения тест-кейса")
         self.precondition_input.textChanged.connect(self._mark_changed)
         self._init_auto_resizing_text_edit(self.precondition_input, min_lines=3, max_lines=10)
@@ -1002,6 +1215,15 @@ class TestCaseFormWidget(QWidget):
         group.setLayout(layout)
         return group
 
+    def _ensure_bulk_operations_group(self) -> QGroupBox:
+        """Создать группу массовых операций при первом обращении и вставить её в форму."""
+        if self.bulk_operations_group is None:
+            group = self._create_bulk_operations_group()
+            group.setVisible(False)
+            self._form_layout.insertWidget(self._bulk_operations_index, group)
+            self.bulk_operations_group = group
+        return self.bulk_operations_group
+
     def _create_bulk_operations_group(self) -> QGroupBox:
         """Группа массовых операций по шагам тест-кейса (только в режиме запуска тестов)"""
         group = QGroupBox("Массовые операции")
@@ -1013,6 +1235,12 @@ class TestCaseFormWidget(QWidget):
         self.stats_label.setStyleSheet("padding: 8px; background-color: rgba(255, 255, 255, 0.05); border-radius: 4px; font-size: 12px;")
         self.stats_label.setWordWrap(True)
         main_layout.addWidget(self.stats_label)
+
+        # Статус автосохранения (показывается только при ошибке записи)
+        self.autosave_status_label = QLabel()
+        self.autosave_status_label.setStyleSheet("padding: 4px 8px; color: #F5555D; font-size: 12px;")
+        self.autosave_status_label.setVisible(False)
+        main_layout.addWidget(self.autosave_status_label)
         
         # Кнопки операций
         buttons_layout = QHBoxLayout()
@@ -1055,7 +1283,7 @@ class TestCaseFormWidget(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, UI_METRICS.group_title_spacing, 0, 0)  # Отступ сверху для заголовка
 
-        self.expected_result_input = QTextEdit()
+        self.expected_result_input = QPlainTextEdit()
         self.expected_result_input.setPlaceholderText("Что должно получиться по завершении кейса")
         self.expected_result_input.textChanged.connect(self._mark_changed)
         self._init_auto_resizing_text_edit(self.expected_result_input, min_lines=3, max_lines=10)
@@ -1092,19 +1320,26 @@ class TestCaseFormWidget(QWidget):
     
     def _create_steps_group(self) -> QGroupBox:
         """Группа шагов тестирования в формате TestOps - единая таблица"""
+        container_padding = UI_METRICS.container_padding
+        group_title_spacing = UI_METRICS.group_title_spacing
+        base_spacing = UI_METRICS.base_spacing
         group = QGroupBox("Шаги тестирования")
         layout = QVBoxLayout()
         layout.setContentsMargins(
-            UI_METRICS.container_padding,
-            UI_METRICS.group_title_spacing,  # Отступ сверху для заголовка
-            UI_METRICS.container_padding,
-            UI_METRICS.base_spacing,
+            container_padding,
+            group_title_spacing,  # Отступ сверху для заголовка
+            container_padding,
+            base_spacing,
         )
-        layout.setSpacing(UI_METRICS.base_spacing)
+        layout.setSpacing(base_spacing)
 
         # Таблица шагов в стиле TestOps
         self.steps_table = _StepsTableWidget(self)  # 5 колонок: №, Действие, Ожидаемый результат, Статус, Действия
         self.steps_table.setColumnCount(5)
+        # Стили кнопок ячеек разбираются один раз на таблицу, а не в каждой строке
+        self.steps_table.setStyleSheet(
+            self.steps_table.styleSheet() + self._STATUS_BUTTONS_QSS + self._STEP_ACTION_BUTTON_QSS
+        )
         
         # Убираем заголовки таблицы
         self.steps_table.horizontalHeader().setVisible(False)
@@ -1122,9 +1357,11 @@ class TestCaseFormWidget(QWidget):
         self.steps_table.setColumnWidth(3, 60)   # Статус (уменьшено для вертикальных кнопок)
         self.steps_table.setColumnWidth(4, 60)   # Действия (уменьшено для вертикальных кнопок)
         
-        # Настройка вертикального заголовка для автоматической подстройки высоты строк
+        # Высоты строк выставляются явно (resizeRowToContents) только у добавленных,
+        # переставленных и изменённых строк и один раз после загрузки; режим
+        # ResizeToContents пересчитывал бы все строки при каждой вставке
         self.steps_table.verticalHeader().setVisible(False)
-        self.steps_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.steps_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.steps_table.verticalHeader().setMinimumSectionSize(50)
         
         # Настройка таблицы
@@ -1155,47 +1392,69 @@ class TestCaseFormWidget(QWidget):
     
     def load_test_case(self, test_case: TestCase):
         """Загрузить тест-кейс в форму"""
+        # Отложенное автосохранение относится к предыдущему тест-кейсу; без test_case_saved,
+        # иначе MainWindow перезагрузит тест-кейсы посреди переключения
+        self.flush_pending_auto_save(notify=False)
         self._is_loading = True
         self.current_test_case = test_case
         self.has_unsaved_changes = False
+        self._auto_save_retries = 0
+        self._set_autosave_status(None)
 
         if test_case:
-            self.title_edit.blockSignals(True)
+            # Сигналы полей не блокируем: _mark_changed молчит, пока идёт загрузка
             self.title_edit.setText(test_case.name or "")
-            self.title_edit.blockSignals(False)
-
-            self.precondition_input.blockSignals(True)
-            self.precondition_input.setText(test_case.preconditions or "")
-            self.precondition_input.blockSignals(False)
+            self.precondition_input.setPlainText(test_case.preconditions or "")
 
-            self.steps_table.blockSignals(True)
-            self.steps_table.setRowCount(0)
-            self.step_statuses = []
-            # Сохраняем attachments из шагов при загрузке
-            self._step_attachments = []
-            for step in test_case.steps:
-                step_attachments = list(step.attachments) if step.attachments else []
-                self._add_step(
-                    step.description, 
-                    step.expected_result, 
-                    step.status or "pending",
-                    attachments=step_attachments
-                )
-            self.steps_table.blockSignals(False)
-            self.steps_table.clearSelection()
-            self._refresh_step_indices()
+            steps_table = self.steps_table
+            # Высоты всех строк пересчитываются после загрузки, а лишние редакторы удаляются
+            self._pending_content_edits.clear()
+            steps_table.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(steps_table):
+                    steps = test_case.steps
+                    # Строки предыдущего тест-кейса переиспользуются: их виджеты
+                    # заполняются заново, создаются и удаляются только недостающие/лишние
+                    reused_rows = min(steps_table.rowCount(), len(steps))
+                    steps_table.setRowCount(reused_rows)
+                    del self._step_cells[reused_rows:]
+                    # Сохраняем attachments из шагов при загрузке
+                    self._step_attachments = []
+                    for row, step in enumerate(steps):
+                        step_attachments = list(step.attachments) if step.attachments else []
+                        if row < reused_rows:
+                            self._reset_step_row(
+                                row,
+                                step.description,
+                                step.expected_result,
+                                step.status or "pending",
+                                attachments=step_attachments
+                            )
+                            continue
+                        self._add_step(
+                            step.description, 
+                            step.expected_result, 
+                            step.status or "pending",
+                            attachments=step_attachments
+                        )
+            finally:
+                steps_table.setUpdatesEnabled(True)
+            steps_table.clearSelection()
+            # Один проход по строкам после загрузки
+            self._pending_index_row = None
+            self._do_refresh_step_indices()
             self._update_table_row_heights()
         else:
-            self.title_edit.blockSignals(True)
             self.title_edit.setText("Не выбран тест-кейс")
-            self.title_edit.blockSignals(False)
             self.precondition_input.clear()
+            self._pending_content_edits.clear()
             self.steps_table.setRowCount(0)
-            self.step_statuses = []
+            self._step_cells = []
             self._step_attachments = []
             self._update_table_row_heights()
 
         self._is_loading = False
+        self._schedule_auto_resize()
         self.unsaved_changes_state.emit(False)
         self._update_step_controls_state()
         self._update_statistics()  # Обновляем статистику при загрузке тест-кейса
@@ -1218,39 +1477,30 @@ class TestCaseFormWidget(QWidget):
         if row != -1:
             self.steps_table.selectRow(row)
 
-        menu = QMenu(self)
-        actions = {
-            "add_new": menu.addAction("➕ Добавить новый шаг"),
-            "insert_above": menu.addAction("↑ Вставить шаг выше"),
-            "insert_below": menu.addAction("↓ Вставить шаг ниже"),
-            "move_up": menu.addAction("⇡ Переместить наверх"),
-            "move_down": menu.addAction("⇣ Переместить вниз"),
-            "remove": menu.addAction("✕ Удалить"),
-        }
-
+        menu, actions = self._ensure_steps_context_menu()
         if row == -1:
             for key in ("insert_above", "insert_below", "move_up", "move_down", "remove"):
                 actions[key].setEnabled(False)
         else:
+            for key in ("insert_above", "insert_below", "remove"):
+                actions[key].setEnabled(True)
             actions["move_up"].setEnabled(row > 0)
             actions["move_down"].setEnabled(row < self.steps_table.rowCount() - 1)
 
         action = menu.exec_(self.steps_table.mapToGlobal(pos))
         if not action:
             return
-
-        if action == actions["add_new"]:
-            self._add_step_to_end()
-        elif action == actions["insert_above"]:
-            self._insert_step_above()
-        elif action == actions["insert_below"]:
-            self._insert_step_below()
-        elif action == actions["move_up"]:
-            self._move_step_up()
-        elif action == actions["move_down"]:
-            self._move_step_down()
-        elif action == actions["remove"]:
-            self._remove_step()
+        getattr(self, action.data())()
+
+    def _ensure_steps_context_menu(self) -> Tuple[QMenu, Dict[str, QAction]]:
+        """Контекстное меню таблицы шагов: создаётся при первом вызове и переиспользуется."""
+        if self._steps_menu is None:
+            self._steps_menu = QMenu(self)
+            for key, text, handler_name in self._STEPS_MENU_SPEC:
+                action = self._steps_menu.addAction(text)
+                action.setData(handler_name)
+                self._steps_menu_actions[key] = action
+        return self._steps_menu, self._steps_menu_actions
 
     def _add_step(self, step_text="", expected_text="", status="pending", row=None, attachments=None):
         """Добавить шаг в таблицу."""
@@ -1267,31 +1517,29 @@ class TestCaseFormWidget(QWidget):
         self.steps_table.setItem(row, 0, index_item)
         
         # Колонка 1: Действие
+        # Новый редактор пуст: текст задаём только если он есть, чтобы не
+        # порождать textChanged; при загрузке сигнал гасит _is_loading
         action_edit = self._create_step_text_edit("Действие...")
-        action_edit.blockSignals(True)
-        action_edit.setPlainText(step_text or "")
+        if step_text:
+            action_edit.setPlainText(step_text)
         action_edit.setReadOnly(not self._edit_mode_enabled)
-        action_edit.blockSignals(False)
         self.steps_table.setCellWidget(row, 1, action_edit)
         
         # Колонка 2: Ожидаемый результат
         expected_edit = self._create_step_text_edit("Ожидаемый результат...")
-        expected_edit.blockSignals(True)
-        expected_edit.setPlainText(expected_text or "")
+        if expected_text:
+            expected_edit.setPlainText(expected_text)
         expected_edit.setReadOnly(not self._edit_mode_enabled)
-        expected_edit.blockSignals(False)
         self.steps_table.setCellWidget(row, 2, expected_edit)
         
         # Колонка 3: Статус
-        status_widget = self._create_step_status_widget(row)
+        status_widget = self._create_step_status_widget()
         self.steps_table.setCellWidget(row, 3, status_widget)
         
         # Колонка 4: Действия (кнопки управления)
-        actions_widget = self._create_step_actions_widget(row)
+        actions_widget = self._create_step_actions_widget()
         self.steps_table.setCellWidget(row, 4, actions_widget)
-        
-        # Сохраняем статус
-        self.step_statuses.insert(row, status or "pending")
+        self._step_cells.insert(row, (action_edit, expected_edit, status_widget, actions_widget))
         
         # Сохраняем attachments
         if attachments is None:
@@ -1301,16 +1549,30 @@ class TestCaseFormWidget(QWidget):
         # Обновляем статус виджета
         self._update_step_status_widget(row, status or "pending")
         
-        # Обновляем индексы и высоты строк
-        self._refresh_step_indices()
-        self._update_table_row_heights()
-        self._update_step_controls_state()
+        if self._is_loading:
+            # При загрузке тест-кейса индексы, высоты строк и кнопки
+            # обновляются один раз после добавления всех шагов
+            return row
         
-        if not self._is_loading:
-            self._mark_changed()
+        # Номера меняются только у строк начиная со вставленной, высота - только у неё
+        self._refresh_step_indices(row)
+        self.steps_table.resizeRowToContents(row)
+        self._update_step_controls_state()
+        self._mark_changed()
         
         return row
 
+    def _reset_step_row(self, row: int, step_text="", expected_text="", status="pending", attachments=None):
+        """Заполнить существующую строку таблицы данными шага (при загрузке тест-кейса)."""
+        action_edit, expected_edit, _status_widget, _actions_widget = self._step_cells[row]
+        for edit, text in ((action_edit, step_text), (expected_edit, expected_text)):
+            if text:
+                edit.setPlainText(text)
+            elif not edit.document().isEmpty():
+                edit.clear()
+        self._step_attachments.insert(row, list(attachments) if attachments else [])
+        self._update_step_status_widget(row, status or "pending")
+
     def _add_step_to_end(self):
         """Добавить шаг в конец."""
         new_row = self._add_step()
@@ -1363,13 +1625,16 @@ class TestCaseFormWidget(QWidget):
         """Удалить шаг по номеру строки."""
         if row < 0 or row >= self.steps_table.rowCount():
             return
+        # Редакторы строки удаляются вместе с ней
+        action_edit, expected_edit, _status_widget, _actions_widget = self._step_cells.pop(row)
+        pending = self._pending_content_edits
+        pending.discard(action_edit)
+        pending.discard(expected_edit)
         self.steps_table.removeRow(row)
-        if row < len(self.step_statuses):
-            self.step_statuses.pop(row)
         if row < len(self._step_attachments):
             self._step_attachments.pop(row)
-        self._refresh_step_indices()
-        self._update_table_row_heights()
+        # Высоты оставшихся строк не меняются, номера - только у строк после удалённой
+        self._refresh_step_indices(row)
         if not self._is_loading:
             self._mark_changed()
         self._update_step_controls_state()
@@ -1380,21 +1645,16 @@ class TestCaseFormWidget(QWidget):
             return
         
         # Получаем содержимое ячеек
-        action_edit_a = self.steps_table.cellWidget(row_a, 1)
-        expected_edit_a = self.steps_table.cellWidget(row_a, 2)
-        action_edit_b = self.steps_table.cellWidget(row_b, 1)
-        expected_edit_b = self.steps_table.cellWidget(row_b, 2)
-        
-        if not all([action_edit_a, expected_edit_a, action_edit_b, expected_edit_b]):
-            return
+        action_edit_a, expected_edit_a = self._step_cells[row_a][:2]
+        action_edit_b, expected_edit_b = self._step_cells[row_b][:2]
         
         # Сохраняем содержимое
         action_a = action_edit_a.toPlainText()
         expected_a = expected_edit_a.toPlainText()
         action_b = action_edit_b.toPlainText()
         expected_b = expected_edit_b.toPlainText()
-        status_a = self.step_statuses[row_a] if row_a < len(self.step_statuses) else "pending"
-        status_b = self.step_statuses[row_b] if row_b < len(self.step_statuses) else "pending"
+        status_a = self._get_step_status(row_a)
+        status_b = self._get_step_status(row_b)
         
         # Меняем местами
         action_edit_a.blockSignals(True)
@@ -1413,13 +1673,8 @@ class TestCaseFormWidget(QWidget):
         expected_edit_b.blockSignals(False)
         
         # Меняем статусы местами
-        if row_a < len(self.step_statuses) and row_b < len(self.step_statuses):
-            self.step_statuses[row_a], self.step_statuses[row_b] = (
-                self.step_statuses[row_b],
-                self.step_statuses[row_a],
-            )
-            self._update_step_status_widget(row_a, self.step_statuses[row_a])
-            self._update_step_status_widget(row_b, self.step_statuses[row_b])
+        self._update_step_status_widget(row_a, status_b)
+        self._update_step_status_widget(row_b, status_a)
         
         # Меняем attachments местами
         if row_a < len(self._step_attachments) and row_b < len(self._step_attachments):
@@ -1428,8 +1683,11 @@ class TestCaseFormWidget(QWidget):
                 self._step_attachments[row_a],
             )
         
-        self._refresh_step_indices()
-        self._update_table_row_heights()
+        # Номера строк при обмене не меняются, а высота могла измениться только
+        # у двух затронутых строк: полный проход по таблице не нужен
+        steps_table = self.steps_table
+        steps_table.resizeRowToContents(row_a)
+        steps_table.resizeRowToContents(row_b)
     
     def _scroll_to_step_and_focus(self, row: int):
         """Прокрутить к шагу и установить фокус на поле 'Действия'"""
@@ -1437,25 +1695,24 @@ class TestCaseFormWidget(QWidget):
             return
         
         # Прокручиваем QScrollArea к блоку шагов
-        steps_group = None
-        for widget in self.findChildren(QGroupBox):
-            if widget.title() == "Шаги тестирования":
-                steps_group = widget
-                break
-        
-        if steps_group and hasattr(self, 'scroll_area'):
-            self._scroll_to_widget(steps_group)
-        
-        # Прокручиваем таблицу к нужной строке
-        QTimer.singleShot(50, lambda: self.steps_table.scrollToItem(
-            self.steps_table.item(row, 0), 
-            QAbstractItemView.PositionAtCenter
-        ))
-        
-        # Устанавливаем фокус на поле "Действия" с задержкой
-        action_edit = self.steps_table.cellWidget(row, 1)
-        if action_edit:
-            QTimer.singleShot(150, lambda: action_edit.setFocus())
+        if hasattr(self, 'scroll_area'):
+            self._scroll_to_widget(self.steps_group)
+        
+        # Прокрутка таблицы и фокус - одним вызовом после текущей итерации цикла событий,
+        # когда QScrollArea уже применила новое положение
+        self._pending_focus_row = row
+        QTimer.singleShot(0, self._apply_scroll_focus)
+
+    @pyqtSlot()
+    def _apply_scroll_focus(self):
+        """Прокрутить таблицу к отложенной строке и поставить фокус на поле 'Действия'."""
+        row = self._pending_focus_row
+        self._pending_focus_row = None
+        # Строка могла исчезнуть, пока вызов ждал в очереди: редактор берём только сейчас
+        if row is None or row >= len(self._step_cells):
+            return
+        self.steps_table.scrollToItem(self.steps_table.item(row, 0), QAbstractItemView.PositionAtCenter)
+        self._step_cells[row][0].setFocus()
     
     def _scroll_to_widget(self, widget: QWidget):
         """Прокрутить QScrollArea к указанному виджету"""
@@ -1484,16 +1741,12 @@ class TestCaseFormWidget(QWidget):
         if not self._edit_mode_enabled:
             return
         
-        for row in range(self.steps_table.rowCount()):
-            actions_widget = self.steps_table.cellWidget(row, 4)
-            if actions_widget:
-                move_up_btn = actions_widget.property("move_up_btn")
-                move_down_btn = actions_widget.property("move_down_btn")
-                if move_up_btn:
-                    move_up_btn.setEnabled(row > 0)
-                if move_down_btn:
-                    move_down_btn.setEnabled(row < self.steps_table.rowCount() - 1)
+        row_count = len(self._step_cells)
+        for row, (_action_edit, _expected_edit, _status_widget, actions_widget) in enumerate(self._step_cells):
+            actions_widget._move_up_btn.setEnabled(row > 0)
+            actions_widget._move_down_btn.setEnabled(row < row_count - 1)
     
+    @pyqtSlot()
     def _mark_changed(self):
         """Пометить как измененное"""
         if self._is_loading:
@@ -1515,35 +1768,35 @@ class TestCaseFormWidget(QWidget):
         self.current_test_case.name = self.title_edit.text().strip()
         self.current_test_case.preconditions = self.precondition_input.toPlainText()
         
-        # Шаги (сохраняем attachments из текущего тест-кейса, если они есть)
+        # Шаги (сохраняем attachments из текущего тест-кейса, если они есть).
+        # Списки и их длины не меняются за время цикла: берём их в локальные переменные
+        existing_steps = self.current_test_case.steps
+        existing_count = len(existing_steps)
+        step_attachments = self._step_attachments
+        attachments_count = len(step_attachments)
+        uuid4 = uuid.uuid4
         steps = []
-        for row in range(self.steps_table.rowCount()):
-            action_edit = self.steps_table.cellWidget(row, 1)
-            expected_edit = self.steps_table.cellWidget(row, 2)
-            if not action_edit or not expected_edit:
-                continue
+        append_step = steps.append
+        for row, (action_edit, expected_edit, status_widget, _actions_widget) in enumerate(self._step_cells):
             step_text = action_edit.toPlainText()
             expected_text = expected_edit.toPlainText()
-            status = self.step_statuses[row] if row < len(self.step_statuses) else "pending"
+            status = status_widget._status
+            existing_step = existing_steps[row] if row < existing_count else None
             
             # Сохраняем attachments из _step_attachments (источник истины для формы)
             attachments = []
-            if row < len(self._step_attachments):
-                attachments = list(self._step_attachments[row])
-            elif row < len(self.current_test_case.steps):
+            if row < attachments_count:
+                attachments = list(step_attachments[row])
+            elif existing_step is not None and existing_step.attachments:
                 # Если в _step_attachments нет, берем из текущего тест-кейса
-                existing_step = self.current_test_case.steps[row]
-                if existing_step.attachments:
-                    attachments = list(existing_step.attachments)
+                attachments = list(existing_step.attachments)
             
             # Получаем ID шага из текущего тест-кейса, если шаг существует
-            step_id = None
-            if row < len(self.current_test_case.steps):
-                step_id = self.current_test_case.steps[row].id
+            step_id = existing_step.id if existing_step is not None else None
             if not step_id:
-                step_id = str(uuid.uuid4())
+                step_id = str(uuid4())
             
-            steps.append(
+            append_step(
                 TestCaseStep(
                     id=step_id,
                     name=f"Шаг {row + 1}",
@@ -1561,11 +1814,19 @@ class TestCaseFormWidget(QWidget):
         
         # Сохраняем через сервис
         if self.service.save_test_case(self.current_test_case):
+            # Изменения статусов записаны вместе с тест-кейсом: отложенное автосохранение
+            # и его ошибка больше не актуальны, повторы считаются заново
+            self._auto_save_timer.stop()
+            self._auto_save_retries = 0
+            self._set_autosave_status(None)
             self.has_unsaved_changes = False
             self.unsaved_changes_state.emit(False)
             self.test_case_saved.emit()
 
     def set_edit_mode(self, enabled: bool):
+        if enabled == self._edit_mode_enabled:
+            # Повторное включение того же режима не должно проходить по всем строкам
+            return
         self._edit_mode_enabled = enabled
         widgets_to_toggle = [
             self.precondition_input,
@@ -1574,22 +1835,26 @@ class TestCaseFormWidget(QWidget):
         for widget in widgets_to_toggle:
             widget.setEnabled(enabled)
 
-        # Обновляем режим редактирования для всех шагов
-        for row in range(self.steps_table.rowCount()):
-            action_edit = self.steps_table.cellWidget(row, 1)
-            expected_edit = self.steps_table.cellWidget(row, 2)
-            if action_edit:
-                action_edit.setReadOnly(not enabled)
-            if expected_edit:
-                expected_edit.setReadOnly(not enabled)
-        
-        # В режиме редактирования: скрыть колонку статусов (3), показать колонку действий (4)
-        self.steps_table.setColumnHidden(3, enabled)  # Скрыть статусы в режиме редактирования
-        self.steps_table.setColumnHidden(4, not enabled)  # Показать действия в режиме редактирования
-        
-        self._update_step_controls_state()
+        # Обновляем режим редактирования для всех шагов одной перерисовкой таблицы
+        steps_table = self.steps_table
+        steps_table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(steps_table):
+                for action_edit, expected_edit, _status_widget, _actions_widget in self._step_cells:
+                    action_edit.setReadOnly(not enabled)
+                    expected_edit.setReadOnly(not enabled)
+
+                # В режиме редактирования: скрыть колонку статусов (3), показать колонку действий (4)
+                steps_table.setColumnHidden(3, enabled)  # Скрыть статусы в режиме редактирования
+                steps_table.setColumnHidden(4, not enabled)  # Показать действия в режиме редактирования
+
+                self._update_step_controls_state()
+        finally:
+            steps_table.setUpdatesEnabled(True)
 
     def set_run_mode(self, enabled: bool):
+        if enabled == self._run_mode_enabled:
+            return
         self._run_mode_enabled = enabled
         
         # В режиме запуска тестов: показать колонку статусов (3), скрыть колонку действий (4)
@@ -1597,41 +1862,124 @@ class TestCaseFormWidget(QWidget):
         self.steps_table.setColumnHidden(4, enabled)  # Скрыть действия в режиме запуска
         
         # Показываем/скрываем группу массовых операций
-        if hasattr(self, 'bulk_operations_group'):
-            self.bulk_operations_group.setVisible(enabled)
-            if enabled:
-                self._update_statistics()  # Обновляем статистику при включении режима запуска
-        
-        # Включаем/выключаем кнопки статусов для всех строк
-        for row in range(self.steps_table.rowCount()):
-            status_widget = self.steps_table.cellWidget(row, 3)
-            if status_widget:
-                buttons = status_widget.property("status_buttons")
-                if buttons:
-                    for btn in buttons:
+        if enabled:
+            self._ensure_bulk_operations_group().setVisible(True)
+            self._update_statistics()  # Обновляем статистику при включении режима запуска
+        elif self.bulk_operations_group is not None:
+            self.bulk_operations_group.setVisible(False)
+        
+        # Включаем/выключаем кнопки статусов для всех строк одной перерисовкой таблицы
+        steps_table = self.steps_table
+        steps_table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(steps_table):
+                for _action_edit, _expected_edit, status_widget, _actions_widget in self._step_cells:
+                    for btn in status_widget._status_buttons:
                         btn.setEnabled(enabled)
+        finally:
+            steps_table.setUpdatesEnabled(True)
 
-    def _refresh_step_indices(self):
-        """Обновить номера шагов в колонке №."""
-        for idx in range(self.steps_table.rowCount()):
-            index_item = self.steps_table.item(idx, 0)
+    def _refresh_step_indices(self, start_row: int = 0):
+        """Запланировать обновление номеров шагов начиная со строки start_row."""
+        if self._is_loading:
+            # После загрузки номера обновляются одним проходом
+            return
+        pending = self._pending_index_row
+        self._pending_index_row = start_row if pending is None else min(pending, start_row)
+        self._step_indices_timer.start()
+
+    @pyqtSlot()
+    def _flush_step_indices(self):
+        """Выполнить отложенное обновление номеров шагов."""
+        start_row = self._pending_index_row
+        if start_row is None:
+            return
+        self._pending_index_row = None
+        self._do_refresh_step_indices(start_row)
+
+    def _do_refresh_step_indices(self, start_row: int = 0):
+        """Обновить номера шагов в колонке № начиная со строки start_row."""
+        steps_table = self.steps_table
+        get_item = steps_table.item
+        row_count = steps_table.rowCount()
+        for idx in range(start_row, row_count):
+            index_text = str(idx + 1)
+            index_item = get_item(idx, 0)
             if index_item:
-                index_item.setText(str(idx + 1))
+                # Номер строки мог не сдвинуться (например, при переиспользовании строк)
+                if index_item.text() != index_text:
+                    index_item.setText(index_text)
             else:
-                index_item = QTableWidgetItem(str(idx + 1))
+                index_item = QTableWidgetItem(index_text)
                 index_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
                 index_item.setFlags(Qt.ItemIsEnabled)
-                self.steps_table.setItem(idx, 0, index_item)
-        self._update_table_row_heights()
+                steps_table.setItem(idx, 0, index_item)
+        # Ширина колонки с номером меняется только вместе с числом разрядов
+        index_digits = len(str(row_count))
+        if index_digits != self._index_column_digits:
+            self._index_column_digits = index_digits
+            steps_table.resizeColumnToContents(0)
 
     def _auto_save_status_change(self):
+        """Запланировать автосохранение статусов: серия кликов записывается на диск один раз."""
         if not self.current_test_case:
             return
         self.current_test_case.updated_at = get_current_datetime()
-        if self.service.save_test_case(self.current_test_case):
+        self._auto_save_timer.start()
+
+    def flush_pending_auto_save(self, notify: bool = True):
+        """Немедленно выполнить запланированное автосохранение статусов, если оно есть.
+
+        notify=False записывает тест-кейс без сигнала test_case_saved: его обработчик
+        перезагружает все тест-кейсы и не должен срабатывать посреди загрузки формы.
+        """
+        if self._auto_save_timer.isActive():
+            self._auto_save_timer.stop()
+            self._do_auto_save(notify)
+
+    @pyqtSlot()
+    def _do_auto_save(self, notify: bool = True):
+        """Записать изменения статусов текущего тест-кейса на диск."""
+        test_case = self.current_test_case
+        if not test_case:
+            return
+        # Запись синхронная: признак несохранённых изменений меняем по её результату
+        if self.service.save_test_case(test_case):
+            self._auto_save_retries = 0
+            self._set_autosave_status(None)
             self.has_unsaved_changes = False
             self.unsaved_changes_state.emit(False)
-            self.test_case_saved.emit()
+            if notify:
+                self.test_case_saved.emit()
+        else:
+            self._on_auto_save_failed(test_case)
+
+    def _on_auto_save_failed(self, test_case: TestCase):
+        """Пометить изменения несохранёнными и запланировать повтор автосохранения."""
+        if not self.has_unsaved_changes:
+            self.has_unsaved_changes = True
+            self.unsaved_changes_state.emit(True)
+        if self._auto_save_retries < self._AUTO_SAVE_MAX_RETRIES:
+            self._auto_save_retries += 1
+            self._set_autosave_status("Не удалось сохранить, повторяем…")
+            QTimer.singleShot(self._AUTO_SAVE_RETRY_DELAY_MS, lambda: self._retry_auto_save(test_case))
+        else:
+            self._set_autosave_status("Не удалось сохранить изменения статусов")
+
+    def _set_autosave_status(self, text: Optional[str]):
+        """Показать ошибку автосохранения под статистикой или скрыть её (text=None)."""
+        if text is None:
+            if self.bulk_operations_group is not None:
+                self.autosave_status_label.setVisible(False)
+            return
+        self._ensure_bulk_operations_group()
+        self.autosave_status_label.setText(text)
+        self.autosave_status_label.setVisible(True)
+
+    def _retry_auto_save(self, test_case: TestCase):
+        """Повторить автосохранение, если тест-кейс всё ещё открыт в форме."""
+        if test_case is self.current_test_case and self.has_unsaved_changes:
+            self._do_auto_save()
 
     def _on_files_dropped_on_step(self, row: int, file_paths: List[Path]):
         """Обработчик drop файлов на строку шага."""
@@ -1678,7 +2026,8 @@ class TestCaseFormWidget(QWidget):
         
         # Обрабатываем каждый файл
         for source_file in file_paths:
-            if not source_file.exists() or not source_file.is_file():
+            # is_file() уже подразумевает существование: один stat вместо двух
+            if not source_file.is_file():
                 continue
             
             # Формируем новое имя: {id тест-кейса}-{id шага}_{оригинальное имя}.{расширение}
@@ -1784,23 +2133,39 @@ class TestCaseFormWidget(QWidget):
         """Отметить все шаги как пройденные"""
         if not self.current_test_case:
             return
-        for row in range(self.steps_table.rowCount()):
-            self._on_step_status_clicked(row, "passed")
-        self._auto_save_status_change()
-        self._update_statistics()  # Обновляем статистику после массовой операции
+        self._apply_status_to_all_steps("passed")
     
     def _reset_all_step_statuses(self):
         """Сбросить статусы всех шагов выбранного тест-кейса"""
         if not self.current_test_case:
             return
-        for row in range(self.steps_table.rowCount()):
-            self._on_step_status_clicked(row, "pending")
+        self._apply_status_to_all_steps("pending")
+
+    def _apply_status_to_all_steps(self, status: str):
+        """Установить статус всем шагам с одним сохранением и одним оповещением."""
+        self._bulk_status_update = True
+        steps_table = self.steps_table
+        steps_table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(steps_table):
+                for row in range(steps_table.rowCount()):
+                    self._on_step_status_clicked(row, status)
+        finally:
+            steps_table.setUpdatesEnabled(True)
+            self._bulk_status_update = False
         self._auto_save_status_change()
-        self._update_statistics()  # Обновляем статистику после массовой операции
+        self._status_notify_timer.start()  # Статистика и оповещение после массовой операции
     
+    @pyqtSlot()
+    def _flush_status_change(self):
+        """Обновить статистику и оповестить об изменении статусов шагов."""
+        self._update_statistics()
+        self.status_changed.emit()
+
     def _update_statistics(self):
         """Обновить статистику по шагам в группе массовых операций"""
-        if not hasattr(self, "stats_label"):
+        if self.bulk_operations_group is None or not self._run_mode_enabled:
+            # Статистика видна только в режиме запуска; при его включении она пересчитывается
             return
         
         if not self.current_test_case or not self.current_test_case.steps:
@@ -1808,18 +2173,13 @@ class TestCaseFormWidget(QWidget):
             return
         
         steps = self.current_test_case.steps
-        total = len(steps)
-        passed = sum(1 for step in steps if step.status == "passed")
-        failed = sum(1 for step in steps if step.status == "failed")
-        skipped = sum(1 for step in steps if step.status == "skipped")
-        pending = sum(1 for step in steps if not step.status or step.status == "pending")
-        
-        # Формируем текст статистики
-        stats_text = f"<b>Статистика по шагам:</b><br>"
-        stats_text += f"Всего: {total} | "
-        stats_text += f"Пройдено: <span style='color: #6CC24A;'>{passed}</span> | "
-        stats_text += f"Осталось: <span style='color: #FFA931;'>{pending}</span> | "
-        stats_text += f"Не пройдено: <span style='color: #F5555D;'>{failed + skipped}</span>"
-        self.stats_label.setText(stats_text)
+        # Один проход по шагам; пустой статус считается "pending"
+        counts = Counter(step.status or "pending" for step in steps)
+        self.stats_label.setText(self._STATS_TEXT_TEMPLATE.format(
+            total=len(steps),
+            passed=counts["passed"],
+            pending=counts["pending"],
+            not_passed=counts["failed"] + counts["skipped"],
+        ))
 
 
@@ -1,21 +1,23 @@
 """Панель информации о тест-кейсе"""
 
-from typing import Optional, List
+from functools import lru_cache
+from typing import Callable, Dict, Optional, List, Set, Tuple
 
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
+    QGridLayout,
     QLabel,
     QLineEdit,
-    QTextEdit,
+    QPlainTextEdit,
     QComboBox,
     QGroupBox,
     QScrollArea,
     QFrame,
 )
 from typing import List
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QEvent
 from PyQt5.QtGui import QTextOption
 
 from ...models import TestCase
@@ -23,6 +25,12 @@ from ...utils.datetime_utils import format_datetime
 from ..styles.ui_metrics import UI_METRICS
 
 
+@lru_cache(maxsize=512)
+def _format_timestamp(value) -> str:
+    """Отформатировать дату создания/изменения; у многих тест-кейсов она совпадает"""
+    return format_datetime(value) if value else "-"
+
+
 class _NoWheelComboBox(QComboBox):
     """Комбо-бокс без изменения значения колесом мыши, пока меню закрыто."""
 
@@ -40,10 +48,52 @@ class InformationPanel(QWidget):
     # Сигнал о том, что данные изменились
     data_changed = pyqtSignal()
 
+    # Задержка пересчёта высоты автоподстраиваемых полей (один кадр)
+    _AUTO_RESIZE_DEBOUNCE_MS = 16
+
+    # Привязки виджетов к полям тест-кейса: (атрибут виджета, поле тест-кейса)
+    _TESTER_BINDINGS = (
+        ("author_input", "author"),
+        ("owner_input", "owner"),
+        ("reviewer_input", "reviewer"),
+    )
+    _COMBO_BINDINGS = (
+        ("status_input", "status"),
+        ("test_layer_input", "test_layer"),
+        ("test_type_input", "test_type"),
+        ("severity_input", "severity"),
+        ("priority_input", "priority"),
+    )
+    _PLAIN_TEXT_BINDINGS = (
+        ("description_input", "description"),
+        ("expected_result_input", "expected_result"),
+    )
+    _TEXT_BINDINGS = (
+        ("environment_input", "environment"),
+        ("browser_input", "browser"),
+        ("test_case_id_input", "test_case_id"),
+        ("issue_links_input", "issue_links"),
+        ("test_case_links_input", "test_case_links"),
+        ("epic_input", "epic"),
+        ("feature_input", "feature"),
+        ("story_input", "story"),
+        ("component_input", "component"),
+    )
+
+    # Выпадающие списки основной информации: (строка, атрибут виджета, подпись, варианты)
+    _CHOICE_COMBO_SPECS = (
+        ("status", "status_input", "Статус:", ["Draft", "Design", "Review", "Done"]),
+        ("status", "test_layer_input", "Test Layer:", ["Unit", "Component", "API", "UI", "E2E", "Integration"]),
+        ("status", "test_type_input", "Тип теста:", ["manual", "automated", "hybrid"]),
+        ("quality", "severity_input", "Severity:", ["BLOCKER", "CRITICAL", "MAJOR", "NORMAL", "MINOR"]),
+        ("quality", "priority_input", "Priority:", ["HIGHEST", "HIGH", "MEDIUM", "LOW", "LOWEST"]),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_test_case: Optional[TestCase] = None
         self._is_loading = False
+        self._auto_resize_timers: List[QTimer] = []
         self._testers_list: List[str] = []  # Список тестировщиков из настроек
         # Видимость элементов (по умолчанию все видимы)
         self._visibility_settings = {
@@ -79,13 +129,35 @@ class InformationPanel(QWidget):
             'description': True,
             'expected_result': True,
         }
+        # Поле тест-кейса -> метод чтения значения виджета для update_test_case
+        self._field_getters: Dict[str, Callable[[], str]] = {}
+        # Виджет -> поле тест-кейса: _on_changed отмечает поле до испускания data_changed
+        self._widget_fields: Dict[QWidget, str] = {}
+        # Поля, изменённые пользователем с момента загрузки или последнего update_test_case
+        self._dirty_fields: Set[str] = set()
+        # Последний разобранный текст тегов и результат разбора
+        self._last_tags_text = ""
+        self._last_tags_list: List[str] = []
         self._setup_ui()
+        for bindings, getter_name in (
+            (self._TESTER_BINDINGS + self._COMBO_BINDINGS, "currentText"),
+            (self._PLAIN_TEXT_BINDINGS, "toPlainText"),
+            (self._TEXT_BINDINGS, "text"),
+        ):
+            for attr, field in bindings:
+                widget = getattr(self, attr)
+                self._field_getters[field] = getattr(widget, getter_name)
+                self._widget_fields[widget] = field
+        self._widget_fields[self.tags_input] = "tags"
 
     def _setup_ui(self):
         """Настройка пользовательского интерфейса"""
+        base_spacing = UI_METRICS.base_spacing
+        section_spacing = UI_METRICS.section_spacing
+        container_padding = UI_METRICS.container_padding
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(UI_METRICS.base_spacing)
+        layout.setSpacing(base_spacing)
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -93,12 +165,12 @@ class InformationPanel(QWidget):
 
         content = QWidget()
         content_layout = QVBoxLayout(content)
-        content_layout.setSpacing(UI_METRICS.section_spacing)
+        content_layout.setSpacing(section_spacing)
         content_layout.setContentsMargins(
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
-            UI_METRICS.container_padding,
+            container_padding,
+            container_padding,
+            container_padding,
+            container_padding,
         )
 
         # Описание (в самом верху)
@@ -134,14 +206,17 @@ class InformationPanel(QWidget):
 
     def _create_main_info_group(self) -> QGroupBox:
         """Создать группу основной информации"""
+        base_spacing = UI_METRICS.base_spacing
+        container_padding = UI_METRICS.container_padding
+        group_title_spacing = UI_METRICS.group_title_spacing
         group = QGroupBox("Основная информация")
         layout = QVBoxLayout(group)
-        layout.setSpacing(UI_METRICS.base_spacing)
+        layout.setSpacing(base_spacing)
         layout.setContentsMargins(
-            UI_METRICS.container_padding,
-            UI_METRICS.group_title_spacing,  # Отступ сверху для заголовка
-            UI_METRICS.container_padding,
-            UI_METRICS.base_spacing,
+            container_padding,
+            group_title_spacing,  # Отступ сверху для заголовка
+            container_padding,
+            base_spacing,
         )
 
         # ID, Created, Updated - сохраняем виджеты для управления видимостью
@@ -158,8 +233,8 @@ class InformationPanel(QWidget):
         layout.addLayout(meta_layout)
 
         # Люди: Автор, Владелец, Ревьюер - сохраняем контейнеры
-        people_layout = QHBoxLayout()
-        people_layout.setSpacing(UI_METRICS.base_spacing)
+        people_layout = QGridLayout()
+        people_layout.setHorizontalSpacing(base_spacing)
         self.author_input = self._create_tester_combo()
         self.author_container = self._add_labeled_widget(people_layout, "Автор:", self.author_input)
 
@@ -170,47 +245,25 @@ class InformationPanel(QWidget):
         self.reviewer_container = self._add_labeled_widget(people_layout, "Ревьюер:", self.reviewer_input)
         layout.addLayout(people_layout)
 
-        # Статус, Test Layer, Тип теста - сохраняем контейнеры
-        status_layout = QHBoxLayout()
-        status_layout.setSpacing(UI_METRICS.base_spacing)
-        self.status_input = _NoWheelComboBox()
-        self.status_input.addItems(["Draft", "Design", "Review", "Done"])
-        self.status_input.setEditable(True)
-        self.status_input.currentTextChanged.connect(self._on_changed)
-        self.status_container = self._add_labeled_widget(status_layout, "Статус:", self.status_input)
-
-        self.test_layer_input = _NoWheelComboBox()
-        self.test_layer_input.addItems(["Unit", "Component", "API", "UI", "E2E", "Integration"])
-        self.test_layer_input.setEditable(True)
-        self.test_layer_input.currentTextChanged.connect(self._on_changed)
-        self.test_layer_container = self._add_labeled_widget(status_layout, "Test Layer:", self.test_layer_input)
-
-        self.test_type_input = _NoWheelComboBox()
-        self.test_type_input.addItems(["manual", "automated", "hybrid"])
-        self.test_type_input.setEditable(True)
-        self.test_type_input.currentTextChanged.connect(self._on_changed)
-        self.test_type_container = self._add_labeled_widget(status_layout, "Тип теста:", self.test_type_input)
-        layout.addLayout(status_layout)
-
-        # Severity, Priority - сохраняем контейнеры
-        quality_layout = QHBoxLayout()
-        quality_layout.setSpacing(UI_METRICS.base_spacing)
-        self.severity_input = _NoWheelComboBox()
-        self.severity_input.addItems(["BLOCKER", "CRITICAL", "MAJOR", "NORMAL", "MINOR"])
-        self.severity_input.setEditable(True)
-        self.severity_input.currentTextChanged.connect(self._on_changed)
-        self.severity_container = self._add_labeled_widget(quality_layout, "Severity:", self.severity_input)
-
-        self.priority_input = _NoWheelComboBox()
-        self.priority_input.addItems(["HIGHEST", "HIGH", "MEDIUM", "LOW", "LOWEST"])
-        self.priority_input.setEditable(True)
-        self.priority_input.currentTextChanged.connect(self._on_changed)
-        self.priority_container = self._add_labeled_widget(quality_layout, "Priority:", self.priority_input)
-        layout.addLayout(quality_layout)
+        # Статус, Test Layer, Тип теста и Severity, Priority - выпадающие списки
+        # по таблице _CHOICE_COMBO_SPECS, по строке сетки на группу; сохраняем контейнеры
+        choice_layouts: Dict[str, QGridLayout] = {}
+        for row_id, attr, label_text, items in self._CHOICE_COMBO_SPECS:
+            row_layout = choice_layouts.get(row_id)
+            if row_layout is None:
+                row_layout = choice_layouts[row_id] = QGridLayout()
+                row_layout.setHorizontalSpacing(base_spacing)
+                layout.addLayout(row_layout)
+            combo = _NoWheelComboBox()
+            self._fill_combo(combo, items)
+            combo.setEditable(True)
+            combo.currentTextChanged.connect(self._on_changed)
+            setattr(self, attr, combo)
+            setattr(self, attr[:-len("_input")] + "_container", self._add_labeled_widget(row_layout, label_text, combo))
 
         # Окружение, Браузер - сохраняем контейнеры
-        environment_layout = QHBoxLayout()
-        environment_layout.setSpacing(UI_METRICS.base_spacing)
+        environment_layout = QGridLayout()
+        environment_layout.setHorizontalSpacing(base_spacing)
         self.environment_input = self._create_line_edit()
         self.environment_container = self._add_labeled_widget(environment_layout, "Окружение:", self.environment_input)
 
@@ -219,8 +272,8 @@ class InformationPanel(QWidget):
         layout.addLayout(environment_layout)
 
         # Test Case ID, Issue Links, TC Links - сохраняем контейнеры
-        links_layout = QHBoxLayout()
-        links_layout.setSpacing(UI_METRICS.base_spacing)
+        links_layout = QGridLayout()
+        links_layout.setHorizontalSpacing(base_spacing)
         self.test_case_id_input = self._create_line_edit()
         self.test_case_id_container = self._add_labeled_widget(links_layout, "Test Case ID:", self.test_case_id_input)
 
@@ -240,7 +293,7 @@ class InformationPanel(QWidget):
         layout.setContentsMargins(10, UI_METRICS.group_title_spacing, 10, 8)  # Отступ сверху для заголовка
         layout.setSpacing(6)
 
-        self.tags_input = QTextEdit()
+        self.tags_input = QPlainTextEdit()
         self.tags_input.setPlaceholderText("Введите теги, каждый с новой строки")
         self.tags_input.textChanged.connect(self._on_changed)
         self._init_auto_resizing_text_edit(self.tags_input, min_lines=2, max_lines=10)
@@ -254,7 +307,7 @@ class InformationPanel(QWidget):
         layout.setContentsMargins(10, UI_METRICS.group_title_spacing, 10, 8)  # Отступ сверху для заголовка
         layout.setSpacing(6)
 
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setPlaceholderText("Подробное описание тест-кейса")
         self.description_input.textChanged.connect(self._on_changed)
         self._init_auto_resizing_text_edit(self.description_input, min_lines=4, max_lines=12)
@@ -264,9 +317,9 @@ class InformationPanel(QWidget):
     def _create_domain_group(self) -> QGroupBox:
         """Создать группу контекста"""
         group = QGroupBox("Контекст (epic / feature / story / component)")
-        layout = QHBoxLayout(group)
+        layout = QGridLayout(group)
         layout.setContentsMargins(10, UI_METRICS.group_title_spacing, 10, 8)  # Отступ сверху для заголовка
-        layout.setSpacing(12)
+        layout.setHorizontalSpacing(12)
 
         self.epic_input = self._create_line_edit()
         self.epic_input.setPlaceholderText("Epic")
@@ -292,7 +345,7 @@ class InformationPanel(QWidget):
         layout = QVBoxLayout()
         layout.setContentsMargins(0, UI_METRICS.group_title_spacing, 0, 0)  # Отступ сверху для заголовка
 
-        self.expected_result_input = QTextEdit()
+        self.expected_result_input = QPlainTextEdit()
         self.expected_result_input.setPlaceholderText("Что должно получиться по завершении кейса")
         self.expected_result_input.textChanged.connect(self._on_changed)
         self._init_auto_resizing_text_edit(self.expected_result_input, min_lines=3, max_lines=10)
@@ -343,225 +396,233 @@ class InformationPanel(QWidget):
         if hasattr(self, 'reviewer_input'):
             self._update_tester_combo(self.reviewer_input)
 
-    def _add_labeled_widget(self, parent_layout: QHBoxLayout, label_text: str, widget):
-        """Добавить виджет с подписью и вернуть контейнер для управления видимостью"""
-        container = QVBoxLayout()
+    def _add_labeled_widget(self, parent_layout: QGridLayout, label_text: str, widget) -> Tuple[QLabel, QWidget]:
+        """Добавить виджет с подписью в следующую колонку сетки и вернуть пару для управления видимостью
+
+        Подпись стоит в строке 0, поле под ней в строке 1: вид тот же, что у отдельного
+        QVBoxLayout на каждое поле, но без вложенных layout-ов.
+        """
+        column = parent_layout.count() // 2
         label = QLabel(label_text)
-        container.addWidget(label)
-        container.addWidget(widget)
-        parent_layout.addLayout(container)
+        parent_layout.addWidget(label, 0, column)
+        parent_layout.addWidget(widget, 1, column)
         # Сохраняем ссылку на label для удобства
         setattr(widget, '_label', label)
-        # Возвращаем контейнер для сохранения ссылки
-        return container
+        return label, widget
 
-    def _init_auto_resizing_text_edit(self, text_edit: QTextEdit, *, min_lines: int = 3, max_lines: int = 12):
-        """Настроить QTextEdit так, чтобы он подстраивал высоту под содержимое."""
+    def _init_auto_resizing_text_edit(self, text_edit: QPlainTextEdit, *, min_lines: int = 3, max_lines: int = 12):
+        """Настроить QPlainTextEdit так, чтобы он подстраивал высоту под содержимое."""
         text_edit.setWordWrapMode(QTextOption.WordWrap)
         text_edit.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         text_edit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        min_height = self._calculate_text_edit_height(text_edit, min_lines)
-        max_height = self._calculate_text_edit_height(text_edit, max_lines)
-        text_edit.setMinimumHeight(min_height)
-        text_edit.setMaximumHeight(max_height)
+        # Границы высоты зависят только от шрифта: считаем их один раз и
+        # пересчитываем по QEvent.FontChange (см. eventFilter)
+        # bounds: высота строки, поля документа, минимальная и максимальная высота
+        bounds = [0, 0, 0, 0]
+        # Число строк при последнем пересчёте: высота меняется только вместе с ним
+        last_line_count = [-1]
+
+        def _update_bounds():
+            line_height, overhead = self._calculate_text_edit_metrics(text_edit)
+            min_height = int(min_lines * line_height + overhead + 8)
+            max_height = int(max_lines * line_height + overhead + 8)
+            bounds[:] = [line_height, overhead, min_height, max_height]
+            text_edit.setMinimumHeight(min_height)
+            text_edit.setMaximumHeight(max_height)
+            last_line_count[0] = -1
 
         def _resize():
-            self._auto_resize_text_edit(text_edit, min_height, max_height)
-
-        text_edit.textChanged.connect(_resize)
+            if self._is_loading:
+                return
+            # У QPlainTextEdit высота документа измеряется в строках
+            line_count = text_edit.document().size().height()
+            if line_count == last_line_count[0]:
+                return
+            last_line_count[0] = line_count
+            self._auto_resize_text_edit(text_edit, line_count, *bounds)
+
+        # Серия textChanged (ввод, вставка, загрузка) схлопывается в один пересчёт высоты
+        resize_timer = QTimer(text_edit)
+        resize_timer.setSingleShot(True)
+        resize_timer.setInterval(self._AUTO_RESIZE_DEBOUNCE_MS)
+        resize_timer.timeout.connect(_resize)
+        text_edit.textChanged.connect(resize_timer.start)
+        self._auto_resize_timers.append(resize_timer)
+
+        def _on_font_change():
+            _update_bounds()
+            resize_timer.start()
+
+        _update_bounds()
+        text_edit._on_font_change = _on_font_change
+        text_edit.installEventFilter(self)
+
+    def _schedule_auto_resize(self):
+        """Пересчитать высоту всех автоподстраиваемых полей после загрузки."""
+        for timer in self._auto_resize_timers:
+            timer.start()
 
     @staticmethod
-    def _calculate_text_edit_height(text_edit: QTextEdit, lines: int) -> int:
-        """Вычислить высоту TextEdit для указанного количества строк"""
-        metrics = text_edit.fontMetrics()
-        line_height = metrics.lineSpacing()
+    def _calculate_text_edit_metrics(text_edit: QPlainTextEdit) -> Tuple[int, float]:
+        """Вычислить высоту строки и вертикальные поля TextEdit за один запрос метрик шрифта"""
         margins = text_edit.contentsMargins()
-        doc_margin = text_edit.document().documentMargin()
-        return int(lines * line_height + doc_margin * 2 + margins.top() + margins.bottom() + 8)
+        overhead = text_edit.document().documentMargin() * 2 + margins.top() + margins.bottom()
+        return text_edit.fontMetrics().lineSpacing(), overhead
+
+    def eventFilter(self, obj, event):
+        """Пересчитать границы высоты автоподстраиваемых полей при смене шрифта"""
+        if event.type() == QEvent.FontChange:
+            on_font_change = getattr(obj, '_on_font_change', None)
+            if on_font_change:
+                on_font_change()
+        return super().eventFilter(obj, event)
 
     @staticmethod
-    def _auto_resize_text_edit(text_edit: QTextEdit, min_height: int, max_height: int):
+    def _auto_resize_text_edit(
+        text_edit: QPlainTextEdit,
+        line_count: float,
+        line_height: int,
+        overhead: float,
+        min_height: int,
+        max_height: int,
+    ):
         """Автоматически изменить высоту TextEdit под содержимое"""
-        doc = text_edit.document()
-        margins = text_edit.contentsMargins()
-        doc_height = doc.size().height() + doc.documentMargin() * 2 + margins.top() + margins.bottom() + 6
-        new_height = max(min_height, min(max_height, int(doc_height)))
+        new_height = max(min_height, min(max_height, int(line_count * line_height + overhead + 6)))
         if text_edit.height() != new_height:
             text_edit.setFixedHeight(new_height)
 
+    @staticmethod
+    def _fill_combo(combo: QComboBox, items: List[str]):
+        """Заполнить ComboBox и запомнить индексы элементов для _set_combo_value"""
+        combo.addItems(items)
+        combo._text_index = {text: index for index, text in enumerate(items)}
+
     def _set_combo_value(self, combo: QComboBox, value: str):
-        """Установить значение в ComboBox"""
-        combo.blockSignals(True)
+        """Установить значение в ComboBox (вызывается при загрузке, сигналы гасит _is_loading)"""
         if value:
-            idx = combo.findText(value)
-            if idx == -1:
-                combo.addItem(value)
+            if combo.currentText() == value:
+                return
+            text_index = combo._text_index
+            idx = text_index.get(value, -1)
+            # Редактируемый комбо-бокс может сам добавить введённый текст,
+            # поэтому индекс сверяем с элементом и при расхождении ищем заново
+            if idx < 0 or combo.itemText(idx) != value:
                 idx = combo.findText(value)
+                if idx == -1:
+                    combo.addItem(value)
+                    idx = combo.count() - 1
+                text_index[value] = idx
             combo.setCurrentIndex(idx)
         else:
             combo.setCurrentIndex(0)
-        combo.blockSignals(False)
 
+    @staticmethod
+    def _assign_text(widget, value: str):
+        """Записать текст в поле; пустое значение лишь очищает непустое поле"""
+        if isinstance(widget, QPlainTextEdit):
+            if value:
+                widget.setPlainText(value)
+            elif not widget.document().isEmpty():
+                widget.clear()
+        elif value:
+            widget.setText(value)
+        elif widget.text():
+            widget.clear()
+
+    @staticmethod
+    def _set_tester_value(combo: QComboBox, value: str):
+        """Выбрать тестировщика из списка или ввести произвольное значение"""
+        index = combo.findText(value, Qt.MatchFixedString)
+        if index >= 0:
+            combo.setCurrentIndex(index)
+        else:
+            combo.setEditText(value)
+
+    @pyqtSlot()
     def _on_changed(self):
         """Обработчик изменения любого поля"""
-        if not self._is_loading:
-            self.data_changed.emit()
+        if self._is_loading:
+            return
+        # Поле отмечается до data_changed: подписчики сразу вызывают update_test_case
+        field = self._widget_fields.get(self.sender())
+        if field is not None:
+            self._dirty_fields.add(field)
+        self.data_changed.emit()
 
     def load_test_case(self, test_case: Optional[TestCase]):
         """Загрузить данные тест-кейса в панель"""
         self._is_loading = True
         self.current_test_case = test_case
+        self._dirty_fields.clear()
 
         if test_case:
             # ID, Created, Updated
             self.id_label.setText(f"ID: {test_case.id or '-'}")
-            created_text = format_datetime(test_case.created_at) if test_case.created_at else "-"
-            updated_text = format_datetime(test_case.updated_at) if test_case.updated_at else "-"
+            created_text = _format_timestamp(test_case.created_at)
+            updated_text = _format_timestamp(test_case.updated_at)
             self.created_label.setText(f"Создан: {created_text}")
             self.updated_label.setText(f"Обновлён: {updated_text}")
 
+            # Сигналы полей не блокируем: _on_changed молчит, пока идёт загрузка
             # Люди (для ComboBox используем setCurrentText или setEditText)
-            self.author_input.blockSignals(True)
-            author_text = test_case.author or ""
-            index = self.author_input.findText(author_text, Qt.MatchFixedString)
-            if index >= 0:
-                self.author_input.setCurrentIndex(index)
-            else:
-                self.author_input.setEditText(author_text)
-            self.author_input.blockSignals(False)
-
-            self.owner_input.blockSignals(True)
-            owner_text = test_case.owner or ""
-            index = self.owner_input.findText(owner_text, Qt.MatchFixedString)
-            if index >= 0:
-                self.owner_input.setCurrentIndex(index)
-            else:
-                self.owner_input.setEditText(owner_text)
-            self.owner_input.blockSignals(False)
-
-            self.reviewer_input.blockSignals(True)
-            reviewer_text = test_case.reviewer or ""
-            index = self.reviewer_input.findText(reviewer_text, Qt.MatchFixedString)
-            if index >= 0:
-                self.reviewer_input.setCurrentIndex(index)
-            else:
-                self.reviewer_input.setEditText(reviewer_text)
-            self.reviewer_input.blockSignals(False)
+            for attr, field in self._TESTER_BINDINGS:
+                self._set_tester_value(getattr(self, attr), getattr(test_case, field) or "")
 
             # Статусы
-            self._set_combo_value(self.status_input, test_case.status or "")
-            self._set_combo_value(self.test_layer_input, test_case.test_layer or "")
-            self._set_combo_value(self.test_type_input, test_case.test_type or "")
-            self._set_combo_value(self.severity_input, test_case.severity or "")
-            self._set_combo_value(self.priority_input, test_case.priority or "")
+            for attr, field in self._COMBO_BINDINGS:
+                self._set_combo_value(getattr(self, attr), getattr(test_case, field) or "")
 
             # Текстовые поля
-            self.tags_input.blockSignals(True)
-            self.tags_input.setText('\n'.join(test_case.tags) if test_case.tags else "")
-            self.tags_input.blockSignals(False)
-
-            self.description_input.blockSignals(True)
-            self.description_input.setText(test_case.description or "")
-            self.description_input.blockSignals(False)
-
-            self.expected_result_input.blockSignals(True)
-            self.expected_result_input.setText(test_case.expected_result or "")
-            self.expected_result_input.blockSignals(False)
-
-            # Окружение
-            self.environment_input.blockSignals(True)
-            self.environment_input.setText(test_case.environment or "")
-            self.environment_input.blockSignals(False)
-
-            self.browser_input.blockSignals(True)
-            self.browser_input.setText(test_case.browser or "")
-            self.browser_input.blockSignals(False)
+            self._assign_text(self.tags_input, '\n'.join(test_case.tags) if test_case.tags else "")
 
-            # Ссылки
-            self.test_case_id_input.blockSignals(True)
-            self.test_case_id_input.setText(test_case.test_case_id or "")
-            self.test_case_id_input.blockSignals(False)
-
-            self.issue_links_input.blockSignals(True)
-            self.issue_links_input.setText(test_case.issue_links or "")
-            self.issue_links_input.blockSignals(False)
-
-            self.test_case_links_input.blockSignals(True)
-            self.test_case_links_input.setText(test_case.test_case_links or "")
-            self.test_case_links_input.blockSignals(False)
-
-            # Контекст
-            self.epic_input.blockSignals(True)
-            self.epic_input.setText(test_case.epic or "")
-            self.epic_input.blockSignals(False)
-
-            self.feature_input.blockSignals(True)
-            self.feature_input.setText(test_case.feature or "")
-            self.feature_input.blockSignals(False)
-
-            self.story_input.blockSignals(True)
-            self.story_input.setText(test_case.story or "")
-            self.story_input.blockSignals(False)
-
-            self.component_input.blockSignals(True)
-            self.component_input.setText(test_case.component or "")
-            self.component_input.blockSignals(False)
+            for attr, field in self._PLAIN_TEXT_BINDINGS + self._TEXT_BINDINGS:
+                self._assign_text(getattr(self, attr), getattr(test_case, field) or "")
         else:
             # Очистить все поля
             self.id_label.setText("ID: -")
             self.created_label.setText("Создан: -")
             self.updated_label.setText("Обновлён: -")
-            self.author_input.setCurrentIndex(0)  # Устанавливаем пустой элемент
-            self.owner_input.setCurrentIndex(0)
-            self.reviewer_input.setCurrentIndex(0)
-            self._set_combo_value(self.status_input, "")
-            self._set_combo_value(self.test_layer_input, "")
-            self._set_combo_value(self.test_type_input, "")
-            self._set_combo_value(self.severity_input, "")
-            self._set_combo_value(self.priority_input, "")
-            self.tags_input.clear()
-            self.description_input.clear()
-            self.expected_result_input.clear()
-            self.environment_input.clear()
-            self.browser_input.clear()
-            self.test_case_id_input.clear()
-            self.issue_links_input.clear()
-            self.test_case_links_input.clear()
-            self.epic_input.clear()
-            self.feature_input.clear()
-            self.story_input.clear()
-            self.component_input.clear()
+            for attr, _field in self._TESTER_BINDINGS:
+                getattr(self, attr).setCurrentIndex(0)  # Устанавливаем пустой элемент
+            for attr, _field in self._COMBO_BINDINGS:
+                self._set_combo_value(getattr(self, attr), "")
+            self._assign_text(self.tags_input, "")
+            for attr, _field in self._PLAIN_TEXT_BINDINGS + self._TEXT_BINDINGS:
+                self._assign_text(getattr(self, attr), "")
 
         self._is_loading = False
+        self._schedule_auto_resize()
 
     def update_test_case(self, test_case: TestCase):
         """Обновить тест-кейс данными из панели"""
         if not test_case:
             return
 
-        test_case.author = self.author_input.currentText()
-        test_case.owner = self.owner_input.currentText()
-        test_case.reviewer = self.reviewer_input.currentText()
-        test_case.status = self.status_input.currentText()
-        test_case.test_layer = self.test_layer_input.currentText()
-        test_case.test_type = self.test_type_input.currentText()
-        test_case.severity = self.severity_input.currentText()
-        test_case.priority = self.priority_input.currentText()
-        test_case.description = self.description_input.toPlainText()
-        test_case.expected_result = self.expected_result_input.toPlainText()
-        test_case.environment = self.environment_input.text()
-        test_case.browser = self.browser_input.text()
-        test_case.test_case_id = self.test_case_id_input.text()
-        test_case.issue_links = self.issue_links_input.text()
-        test_case.test_case_links = self.test_case_links_input.text()
-        test_case.epic = self.epic_input.text()
-        test_case.feature = self.feature_input.text()
-        test_case.story = self.story_input.text()
-        test_case.component = self.component_input.text()
+        if test_case is self.current_test_case:
+            # Остальные поля совпадают с загруженными в панель значениями
+            fields = self._dirty_fields
+        else:
+            fields = set(self._field_getters) | {"tags"}
+
+        # Записываем только изменившиеся поля
+        field_getters = self._field_getters
+        for field in fields:
+            getter = field_getters.get(field)
+            if getter is None:
+                continue
+            value = getter()
+            if getattr(test_case, field) != value:
+                setattr(test_case, field, value)
 
         # Теги
-        tags_text = self.tags_input.toPlainText().strip()
-        test_case.tags = [t.strip() for t in tags_text.split('\n') if t.strip()]
+        if "tags" in fields:
+            tags_text = self.tags_input.toPlainText().strip()
+            if tags_text != self._last_tags_text:
+                self._last_tags_text = tags_text
+                self._last_tags_list = [t.strip() for t in tags_text.split('\n') if t.strip()]
+            # Копия: разобранный список не должен разделяться между тест-кейсами
+            test_case.tags = list(self._last_tags_list)
+        self._dirty_fields = set()
 
     def set_edit_mode(self, enabled: bool):
         """Установить режим редактирования"""
@@ -597,6 +658,16 @@ class InformationPanel(QWidget):
     
     def _apply_visibility_settings(self):
         """Применить настройки видимости элементов (каждый элемент отдельно)"""
+        # Десятки setVisible подряд: панель перерисовывается один раз в конце
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_widgets_visibility()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+    def _set_widgets_visibility(self):
+        """Показать/скрыть поля и группы согласно _visibility_settings"""
         # Метаданные - отдельные элементы
         if hasattr(self, 'id_label'):
             self.id_label.setVisible(self._visibility_settings.get('id', True))
@@ -692,9 +763,7 @@ class InformationPanel(QWidget):
         
         visible = self._visibility_settings.get(setting_key, True)
         
-        # Скрываем/показываем все виджеты в контейнере
-        for i in range(container.count()):
-            item = container.itemAt(i)
-            if item and item.widget():
-                item.widget().setVisible(visible)
+        # Скрываем/показываем подпись и поле
+        for widget in container:
+            widget.setVisible(visible)
 
@@ -70,15 +70,12 @@ class ChatMessageWidget(QWidget):
             return None
         
         try:
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
+            svg_content = icon_path.read_bytes()
             
             if color:
-                svg_content = svg_content.replace('currentColor', color)
-                svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-                svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
+                svg_content = svg_content.replace(b'currentColor', color.encode('ascii'))
             
-            renderer = QSvgRenderer(svg_content.encode('utf-8'))
+            renderer = QSvgRenderer(svg_content)
             if not renderer.isValid():
                 return None
             
@@ -321,15 +318,12 @@ class ManualReviewPanel(QWidget):
             return None
         
         try:
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
+            svg_content = icon_path.read_bytes()
             
             if color:
-                svg_content = svg_content.replace('currentColor', color)
-                svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-                svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
+                svg_content = svg_content.replace(b'currentColor', color.encode('ascii'))
             
-            renderer = QSvgRenderer(svg_content.encode('utf-8'))
+            renderer = QSvgRenderer(svg_content)
             if not renderer.isValid():
                 return None
             
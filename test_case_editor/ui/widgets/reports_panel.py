@@ -230,17 +230,14 @@ class ReportsPanel(QWidget):
         
         try:
             # Читаем содержимое SVG файла
-            with open(icon_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
+            svg_content = icon_path.read_bytes()
             
             # Если указан цвет, заменяем currentColor на конкретный цвет
             if color:
-                svg_content = svg_content.replace('currentColor', color)
-                svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-                svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
+                svg_content = svg_content.replace(b'currentColor', color.encode('ascii'))
             
             # Создаем рендерер SVG из модифицированного содержимого
-            renderer = QSvgRenderer(svg_content.encode('utf-8'))
+            renderer = QSvgRenderer(svg_content)
             if not renderer.isValid():
                 print(f"Невалидный SVG файл: {icon_path}")
                 return None